@@ -0,0 +1,64 @@
+# benchmarks/bench_linkedin_parser.py
+#
+# Checks that every LinkedIn card parser backend returns identical JobCard
+# tuples on the saved fixtures, then times each backend.
+#
+#   python benchmarks/bench_linkedin_parser.py [iterations]
+
+import glob
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from src.utils.linkedin_parser import HAS_LXML, PARSERS, parse_job_cards_full
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+
+def load_fixtures():
+    fixtures = {}
+    for path in sorted(glob.glob(os.path.join(FIXTURES_DIR, 'linkedin_*.html'))):
+        with open(path, 'rb') as f:
+            fixtures[os.path.basename(path)] = f.read()
+    return fixtures
+
+
+def check_equivalence(fixtures, backends):
+    """The original full-tree parse is the reference every other backend must match"""
+    ok = True
+    for name, content in fixtures.items():
+        expected = parse_job_cards_full(content)
+        for backend in backends:
+            got = PARSERS[backend](content)
+            status = '✓' if got == expected else '✗'
+            if got != expected:
+                ok = False
+            print(f"  {status} {name:<40} {backend:<5} {len(got)} cards")
+    return ok
+
+
+def main():
+    iterations = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    fixtures = load_fixtures()
+    backends = [b for b in PARSERS if b != 'lxml' or HAS_LXML]
+
+    print("Equivalence vs original parser:")
+    if not check_equivalence(fixtures, [b for b in backends if b != 'bs4']):
+        print("\n❌ Backends disagree")
+        sys.exit(1)
+
+    page = fixtures['linkedin_search_page.html']
+    print(f"\nTiming ({iterations} parses of linkedin_search_page.html):")
+    for backend in backends:
+        parse = PARSERS[backend]
+        start = time.perf_counter()
+        for _ in range(iterations):
+            parse(page)
+        elapsed = time.perf_counter() - start
+        print(f"  {backend:<5} {iterations / elapsed:>10,.0f} pages/sec")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+# benchmarks/bench_title_classifier.py
+#
+# Micro-benchmark: titles/sec of the old per-call regex filter vs the
+# precompiled single-pass classifier in src/utils/title_classifier.py.
+#
+#   python benchmarks/bench_title_classifier.py [num_titles]
+
+import os
+import random
+import re
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from src.utils.title_classifier import classify_title, classify_titles
+
+
+def legacy_is_valid(title):
+    """The filter_jobs logic as it was before the shared classifier (lists rebuilt per call)"""
+    title = title.lower()
+    valid_phrases = [
+        r'\bai intern\b', r'\bai trainee\b', r'\bai research intern\b',
+        r'\bartificial intelligence intern\b', r'\bmachine learning intern\b',
+        r'\bml intern\b', r'\bai placement\b', r'\bartificial intelligence placement\b'
+    ]
+    ai_terms = [
+        r'\bai\b', r'\bartificial intelligence\b', r'\bmachine learning\b', r'\bml\b',
+        r'\bdeep learning\b', r'\bcomputer vision\b', r'\bnlp\b', r'\bllm\b', r'\bgenerative ai\b'
+    ]
+    intern_terms = [
+        r'\bintern\b', r'\binternship\b', r'\btrainee\b', r'\bplacement\b',
+        r'\bstudent\b', r'\bundergraduate\b'
+    ]
+    blacklist = ['senior', 'manager', 'lead', 'director', 'marketing', 'sales', 'hr', 'recruiter', 'agent', 'attorney', 'counsel']
+
+    if any(bad in title for bad in blacklist):
+        return False
+    for pattern in valid_phrases:
+        if re.search(pattern, title):
+            return True
+    has_ai = any(re.search(p, title) for p in ai_terms)
+    has_intern = any(re.search(p, title) for p in intern_terms)
+    return has_ai and has_intern
+
+
+def make_titles(n, seed=42):
+    rng = random.Random(seed)
+    prefixes = ['', 'Junior ', 'Senior ', 'Graduate ', 'Summer ', 'Lead ', '2026 ']
+    cores = [
+        'AI Intern', 'AI Research Intern', 'Machine Learning Engineer', 'ML Internship',
+        'Software Engineer', 'Data Scientist', 'Computer Vision Trainee', 'NLP Student Researcher',
+        'Marketing Intern', 'Sales Manager', 'Trainee Patent Attorney', 'Deep Learning Placement',
+        'Backend Developer', 'Generative AI Undergraduate Programme', 'Product Designer',
+    ]
+    suffixes = ['', ' - London', ' (Remote)', ' | 12 months', ', UK', ' - Summer 2026']
+    return [rng.choice(prefixes) + rng.choice(cores) + rng.choice(suffixes) for _ in range(n)]
+
+
+def bench(label, fn, titles):
+    start = time.perf_counter()
+    fn(titles)
+    elapsed = time.perf_counter() - start
+    print(f"  {label:<40} {len(titles) / elapsed:>12,.0f} titles/sec")
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    titles = make_titles(n)
+    unique_titles = list(dict.fromkeys(titles))
+
+    print(f"Benchmarking {n} titles ({len(unique_titles)} unique)")
+    bench("before: legacy per-call regex lists", lambda ts: [legacy_is_valid(t) for t in ts], titles)
+    bench("after:  classify_title (one pass)", lambda ts: [classify_title(t) for t in ts], titles)
+    bench("after:  classify_titles (batch)", classify_titles, titles)
+
+    # The shared classifier matches on word starts for the blacklist ('hr' no longer
+    # drops 'three'/'Chrome'); report any titles where the verdicts differ.
+    diffs = [t for t in unique_titles if legacy_is_valid(t) != classify_title(t).is_match]
+    print(f"\n  Verdict differences vs legacy: {len(diffs)}")
+    for t in diffs[:10]:
+        print(f"    {t!r}: legacy={legacy_is_valid(t)} new={classify_title(t)}")
+
+
+if __name__ == "__main__":
+    main()
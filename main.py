@@ -1,16 +1,80 @@
 # main.py
 
 import json
+import argparse
 from src.agents.job_link_scraper import JobLinkScraper
 from src.agents.cv_generator import CVGenerator
 from src.utils.pdf_generator import PDFGenerator
+from src.utils.render_manifest import RenderManifest
+from src.utils.http_client import get_client
+from src.utils.seen_jobs import SeenJobsIndex
+from src.utils.llm_cache import LLMResponseCache
+from src.utils.context_cache import GeminiContextCache
+from src.utils.jd_store import JDStore
+from src.utils.tailoring_reuse import TailoringReuseIndex
 from datetime import datetime
 import os
 import sys
 
-def main():
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Agentic AI Resume Creator")
+    parser.add_argument('--new-only', action='store_true',
+                        help="Only tailor CVs for jobs with no tailored CV from an earlier run")
+    parser.add_argument('--no-seen-index', action='store_true',
+                        help="Disable the persistent seen-jobs index (full re-crawl every run)")
+    parser.add_argument('--sources', default='linkedin',
+                        help="Comma-separated job sources to run in parallel "
+                             "(linkedin, startups, company_careers, ats_boards, graduate_schemes, tech_boards)")
+    parser.add_argument('--max-cvs', type=int, default=5,
+                        help="Maximum number of CVs to tailor")
+    parser.add_argument('--max-in-flight', type=int, default=1,
+                        help="Number of concurrent Gemini requests")
+    parser.add_argument('--rpm', type=int, default=30,
+                        help="Gemini requests-per-minute quota")
+    parser.add_argument('--tpm', type=int, default=None,
+                        help="Gemini tokens-per-minute quota (default: unlimited)")
+    parser.add_argument('--no-llm-cache', action='store_true',
+                        help="Always call Gemini, even for unchanged CV/pool/JD inputs")
+    parser.add_argument('--project-top-k', type=int, default=5,
+                        help="Projects from the pool shortlisted (BM25) into each prompt")
+    parser.add_argument('--context-cache', action='store_true',
+                        help="Upload the static prompt prefix (instructions, CV, project pool) once via Gemini context caching")
+    parser.add_argument('--batch-size', type=int, default=1,
+                        help="Jobs packed into each Gemini request (bulk/overnight runs)")
+    parser.add_argument('--stream', action='store_true',
+                        help="Stream Gemini responses (needed for --min-match-score)")
+    parser.add_argument('--min-match-score', type=float, default=None,
+                        help="With --stream, cancel generation for jobs scoring below this")
+    parser.add_argument('--prescreen', action='store_true',
+                        help="Rank all jobs locally against your CV/projects and tailor the best --max-cvs")
+    parser.add_argument('--token-budget', type=int, default=None,
+                        help="With --prescreen, estimated Gemini token budget for the run")
+    parser.add_argument('--prefetch-depth', type=int, default=4,
+                        help="Job descriptions fetched ahead of Gemini generation (0 disables prefetching)")
+    parser.add_argument('--tailoring-model', default='gemini-2.5-flash',
+                        help="Model for full CV tailoring")
+    parser.add_argument('--analysis-model', default=None,
+                        help="Cheap model (e.g. gemini-2.5-flash-lite, or 'local') that scores every job first; "
+                             "only jobs above --analysis-threshold are tailored")
+    parser.add_argument('--analysis-threshold', type=float, default=60,
+                        help="Minimum analysis-tier match score for tailoring")
+    parser.add_argument('--output-mode', choices=['full', 'delta'], default='full',
+                        help="'delta': Gemini returns only the changed sections, merged onto your CV locally")
+    parser.add_argument('--no-reuse', action='store_true',
+                        help="Disable reusing tailored CVs for near-duplicate job descriptions")
+    parser.add_argument('--reuse-threshold', type=float, default=0.8,
+                        help="Similarity (0-1) above which a near-duplicate JD reuses an earlier tailored CV")
+    parser.add_argument('--pdf-workers', type=int, default=None,
+                        help="Processes for PDF rendering (default: one per CPU core; 1 = render serially)")
+    parser.add_argument('--rerender-pdfs', action='store_true',
+                        help="Rebuild every PDF, even ones whose tailored CV is unchanged since the last render")
+    return parser.parse_args(argv)
+
+def main(argv=None):
     """Main orchestrator for the two-part agent system"""
     
+    args = parse_args(argv)
+    
     print("="*60)
     print("🤖 AGENTIC AI RESUME CREATOR")
     print("="*60)
@@ -35,7 +99,9 @@ def main():
     print("PART 1: JOB LINK SCRAPING")
     print("="*60)
     
-    scraper = JobLinkScraper()
+    seen_index = None if args.no_seen_index else SeenJobsIndex('data/jobs/seen_jobs.sqlite')
+    enabled_sources = [name.strip() for name in args.sources.split(',') if name.strip()]
+    scraper = JobLinkScraper(seen_index=seen_index, enabled_sources=enabled_sources)
     job_links = scraper.scrape_all_platforms()
     
     # Save scraped links
@@ -55,7 +121,17 @@ def main():
     
     if not job_links:
         print("⚠️ No jobs found. Exiting.")
+        scraper.close()
         return
+    
+    cv_jobs = job_links
+    if args.new_only:
+        cv_jobs = scraper.filter_new_jobs(job_links)
+        print(f"\n🆕 --new-only: {len(cv_jobs)} of {len(job_links)} jobs have no tailored CV from an earlier run")
+        if not cv_jobs:
+            print("⚠️ No new jobs to tailor. Exiting.")
+            scraper.close()
+            return
 
     # ========================================
     # PART 2: GENERATE TAILORED CVS
@@ -68,11 +144,37 @@ def main():
     cv_generator = CVGenerator(
         api_key=api_keys['gemini_api_key'],
         current_cv_path='data/profile/my_current_cv.json',
-        project_pool_path='data/profile/project_pool.json'
+        project_pool_path='data/profile/project_pool.json',
+        max_in_flight=args.max_in_flight,
+        rpm=args.rpm,
+        tpm=args.tpm,
+        llm_cache=None if args.no_llm_cache else LLMResponseCache('data/cache/llm_cache.sqlite'),
+        project_top_k=args.project_top_k,
+        context_cache=GeminiContextCache() if args.context_cache else None,
+        batch_size=args.batch_size,
+        stream=args.stream or args.min_match_score is not None,
+        min_match_score=args.min_match_score,
+        prescreen=args.prescreen,
+        token_budget=args.token_budget,
+        prefetch_depth=args.prefetch_depth,
+        jd_store=JDStore('data/jobs/jd_store.sqlite'),
+        models={'tailoring': args.tailoring_model, 'analysis': args.analysis_model},
+        analysis_threshold=args.analysis_threshold,
+        output_mode=args.output_mode,
+        reuse_index=None if args.no_reuse else TailoringReuseIndex('data/cache/reuse_index.sqlite',
+                                                                   threshold=args.reuse_threshold),
+        fetcher=scraper.fetcher
     )
     
     # For MVP, maybe limit to fewer CVs to save tokens/time if needed, but keeping 100 as per request
-    tailored_cvs = cv_generator.generate_all_cvs(job_links, max_cvs=5) 
+    try:
+        tailored_cvs = cv_generator.generate_all_cvs(cv_jobs, max_cvs=args.max_cvs)
+        # Only saved CVs count as done: untailored jobs stay eligible for --new-only
+        scraper.mark_tailored([cv_data['job'] for cv_data in tailored_cvs])
+    finally:
+        if cv_generator.context_cache is not None:
+            cv_generator.context_cache.close()
+        scraper.close()
     
     # Save all results
     results_file = f'data/results/results_{timestamp}.json'
@@ -96,17 +198,14 @@ def main():
     print("GENERATING PDF CVS")
     print("="*60)
     
-    pdf_gen = PDFGenerator()
+    pdf_gen = PDFGenerator(manifest=None if args.rerender_pdfs else RenderManifest())
     
-    for i, cv_data in enumerate(tailored_cvs, 1):
-        try:
-            pdf_gen.generate_resume_pdf(
-                cv_data['tailored_cv']['tailored_cv'],
-                cv_data['job']['title'],
-                cv_data['job']['company']
-            )
-        except Exception as e:
-            print(f"❌ Error generating PDF for {cv_data['job']['company']}: {e}")
+    pdf_reports = pdf_gen.render_all(
+        [(cv_data['tailored_cv']['tailored_cv'], cv_data['job']['title'], cv_data['job']['company'])
+         for cv_data in tailored_cvs],
+        workers=args.pdf_workers
+    )
+    pdf_errors = [r for r in pdf_reports if r['error']]
     
     # ========================================
     # FINAL SUMMARY
@@ -117,6 +216,10 @@ def main():
     print(f"\n📊 FINAL SUMMARY:")
     print(f"   Jobs Scraped: {len(job_links)}")
     print(f"   CVs Generated: {len(tailored_cvs)}")
+    pdf_skipped = sum(1 for r in pdf_reports if r['skipped'])
+    print(f"   PDFs Ready: {len(pdf_reports) - len(pdf_errors)}/{len(pdf_reports)} ({pdf_skipped} unchanged, not re-rendered)")
+    for report in pdf_errors:
+        print(f"      ❌ {report['title']} at {report['company']}: {report['error']}")
     if tailored_cvs:
         avg_score = sum([cv['tailored_cv']['job_analysis']['match_score'] for cv in tailored_cvs]) / len(tailored_cvs)
         print(f"   Average Match Score: {avg_score:.1f}")
@@ -127,6 +230,16 @@ def main():
     print(f"   CV JSONs: data/resumes/tailored_json/")
     print(f"   CV PDFs: data/resumes/generated/")
     
+    http_cache = get_client().cache
+    if http_cache:
+        http_cache.print_stats()
+    if cv_generator.llm_cache is not None:
+        cv_generator.llm_cache.print_stats()
+    if cv_generator.jd_store is not None:
+        cv_generator.jd_store.print_stats()
+    if cv_generator.reuse_index is not None:
+        cv_generator.reuse_index.print_stats()
+    
     if tailored_cvs:
         print(f"\n🎯 TOP MATCHES:")
         top_matches = sorted(tailored_cvs, key=lambda x: x['tailored_cv']['job_analysis']['match_score'], reverse=True)[:5]
@@ -0,0 +1,132 @@
+# src/agents/ats_ingestor.py
+
+import html
+import re
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from bs4 import BeautifulSoup
+
+from src.utils.http_client import get_client
+from src.utils.json_stream import iter_json_array
+from src.utils.rate_control import CircuitOpenError, THROTTLE_STATUSES
+from src.utils.title_classifier import classify_title
+
+# Word-bounded so 'uk' doesn't match 'Milwaukee'
+LOCATION_PATTERN = re.compile(r'\b(?:uk|united kingdom|london|england|scotland|wales|remote)\b', re.IGNORECASE)
+
+
+class ATSIngestor:
+    """
+    Bulk ingestion from Greenhouse and Lever board APIs.
+    - asks the API for descriptions inline (Greenhouse ?content=true, Lever ?mode=json)
+    - streams each board's payload and filters title + location per posting in one pass
+    - fills 'description' directly, so CVGenerator never needs a second HTML fetch
+    - boards are fetched concurrently, so this scales to hundreds of companies
+    """
+
+    def __init__(self, greenhouse_boards=None, lever_boards=None, client=None, max_workers=8, timeout=15,
+                 breakers=None):
+        self.greenhouse_boards = list(greenhouse_boards or ['airbnb', 'stripe', 'notion', 'figma'])
+        self.lever_boards = list(lever_boards or ['spotify', 'netflix'])
+        self.http = client or get_client()
+        self.max_workers = max_workers
+        self.timeout = timeout
+        # Optional CircuitBreakerRegistry: a failing board API host is skipped during its cool-down
+        self.breakers = breakers
+
+    def ingest(self, cancel_event=None):
+        """Fetch every configured board and return the matching jobs"""
+        boards = [(self.ingest_greenhouse, co) for co in self.greenhouse_boards]
+        boards += [(self.ingest_lever, co) for co in self.lever_boards]
+        if not boards:
+            return []
+
+        jobs = []
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(boards)), thread_name_prefix='ats') as executor:
+            futures = [executor.submit(fn, co, cancel_event) for fn, co in boards]
+            for future in futures:
+                try:
+                    jobs.extend(future.result())
+                except Exception as e:
+                    print(f"    ⚠️ ATS board error: {e}")
+        return jobs
+
+    def _stream(self, url, params, key=None):
+        breaker = self.breakers.for_url(url) if self.breakers is not None else None
+        if breaker is not None and not breaker.allow():
+            raise CircuitOpenError(f"{breaker.name} paused for another {breaker.cooldown_remaining():.0f}s")
+        try:
+            response = self.http.get(url, params=params, timeout=self.timeout, stream=True)
+        except Exception as e:
+            if breaker is not None:
+                breaker.record_failure(type(e).__name__)
+            raise
+        try:
+            if response.status_code in THROTTLE_STATUSES or response.status_code >= 500:
+                if breaker is not None:
+                    breaker.record_failure(f"HTTP {response.status_code}")
+                raise RuntimeError(f"Status {response.status_code} from {url}")
+            if breaker is not None:
+                breaker.record_success()
+            if response.status_code != 200:
+                # e.g. 404 for an unknown board: the board is wrong, not the host
+                raise RuntimeError(f"Status {response.status_code} from {url}")
+            yield from iter_json_array(response.iter_content(chunk_size=64 * 1024), key=key)
+        finally:
+            response.close()
+
+    @staticmethod
+    def _is_match(title, location):
+        return bool(title) and LOCATION_PATTERN.search(location or '') is not None and classify_title(title).is_match
+
+    @staticmethod
+    def _html_to_text(markup):
+        return BeautifulSoup(markup, 'html.parser').get_text('\n', strip=True)
+
+    def ingest_greenhouse(self, co, cancel_event=None):
+        jobs = []
+        url = f"https://boards-api.greenhouse.io/v1/boards/{co}/jobs"
+        for j in self._stream(url, {'content': 'true'}, key='jobs'):
+            if cancel_event is not None and cancel_event.is_set():
+                break
+            location = (j.get('location') or {}).get('name', '')
+            if not self._is_match(j.get('title'), location):
+                continue
+            # Greenhouse returns the description as entity-escaped HTML
+            description = self._html_to_text(html.unescape(j.get('content') or ''))
+            jobs.append({
+                'title': j['title'],
+                'company': co.title(),
+                'location': location,
+                'url': j['absolute_url'],
+                'description': description,
+                'source': 'Greenhouse',
+                'scraped_at': datetime.now().isoformat()
+            })
+        return jobs
+
+    def ingest_lever(self, co, cancel_event=None):
+        jobs = []
+        url = f"https://api.lever.co/v0/postings/{co}"
+        for j in self._stream(url, {'mode': 'json'}):
+            if cancel_event is not None and cancel_event.is_set():
+                break
+            location = (j.get('categories') or {}).get('location', '')
+            if not self._is_match(j.get('text'), location):
+                continue
+            parts = [j.get('descriptionPlain', '')]
+            for section in j.get('lists') or []:
+                parts.append(section.get('text', ''))
+                parts.append(self._html_to_text(section.get('content', '')))
+            parts.append(j.get('additionalPlain', ''))
+            jobs.append({
+                'title': j['text'],
+                'company': co.title(),
+                'location': location,
+                'url': j['hostedUrl'],
+                'description': '\n'.join(p.strip() for p in parts if p and p.strip()),
+                'source': 'Lever',
+                'scraped_at': datetime.now().isoformat()
+            })
+        return jobs
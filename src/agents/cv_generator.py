@@ -5,107 +5,39 @@ import google.generativeai as genai
 from datetime import datetime
 import time
 import os
-import requests
-from bs4 import BeautifulSoup
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from src.utils.async_fetcher import AsyncFetcher
+from src.utils.cv_delta import merge_delta, with_project_ids
+from src.utils.cv_schema import (ANALYSIS_RESULT, DELTA_RESULT, JOB_ANALYSIS, TAILORED_CV_RESULT, get_section,
+                                 set_section, validate_result)
+from src.utils.http_client import get_client
+from src.utils.jd_extraction import extract_description, normalize_description
+from src.utils.job_identity import canonical_job_id
+from src.utils.json_stream import ObjectMemberScanner, repair_json
+from src.utils.llm_cache import make_key, normalize_text
+from src.utils.llm_scheduler import QuotaScheduler, estimate_tokens
+from src.utils.prefetch_pipeline import PrefetchPipeline
+from src.utils.tailoring_reuse import patch_company
+from src.utils.text_vectors import BM25Index, flatten_text, tokenize
 
-class CVGenerator:
-    def __init__(self, api_key, current_cv_path, project_pool_path=None):
-        genai.configure(api_key=api_key)
-        self.model = genai.GenerativeModel('gemini-2.5-flash')
-        self.current_cv = self.load_json(current_cv_path)
-        self.project_pool = self.load_json(project_pool_path) if project_pool_path else []
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
-    
-    def load_json(self, path):
-        """Load JSON file content"""
-        if not path or not os.path.exists(path):
-            print(f"⚠️ Warning: File not found at {path}")
-            return [] if 'pool' in str(path) else {}
-        with open(path, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    
-    def fetch_job_description(self, job_url, source):
-        """Fetch full job description from URL using requests"""
-        try:
-            # Simple GET request
-            response = requests.get(job_url, headers=self.headers, timeout=10)
-            
-            if response.status_code != 200:
-                print(f"  ⚠️ Status {response.status_code} fetching JD")
-                return ''
-                
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Platform-specific selectors
-            desc_elem = None
-            if 'linkedin.com' in job_url:
-                desc_elem = soup.find('div', class_='description__text') or \
-                           soup.find('div', class_='show-more-less-html__markup') or \
-                           soup.find('section', class_='description')
-            elif 'indeed.com' in job_url or 'indeed.co.uk' in job_url:
-                desc_elem = soup.find('div', id='jobDescriptionText')
-            elif 'glassdoor' in job_url:
-                desc_elem = soup.find('div', class_='jobDescriptionContent')
-            else:
-                desc_elem = soup.find('div', class_='description') or soup.find('div', id='job-description')
-            
-            description = desc_elem.text.strip() if desc_elem else ''
-            
-            if not description:
-                # Fallback: try to find any large text block
-                paragraphs = soup.find_all('p')
-                long_paragraphs = [p.text.strip() for p in paragraphs if len(p.text.strip()) > 50]
-                if long_paragraphs:
-                    description = ' '.join(long_paragraphs)
-            
-            return description
-            
-        except Exception as e:
-            print(f"  ❌ Error fetching JD: {e}")
-            return ''
-    
-    def generate_tailored_cv(self, job):
-        """Generate tailored CV using Gemini API"""
-        
-        print(f"\n🎯 Tailoring CV for: {job['title']} at {job['company']}")
-        
-        # Fetch full job description
-        print("  📄 Fetching job description...")
-        job_description = self.fetch_job_description(job['url'], job['source'])
-        
-        if not job_description:
-            print("  ⚠️  No job description found (or blocked), using title only...")
-            job_description = f"Job Title: {job['title']} at {job['company']}. Location: {job['location']}. (Full description could not be fetched)."
-        else:
-            print(f"  ✓ Got JD ({len(job_description)} chars)")
-        
-        # Create prompt with current CV and job details
-        prompt = f"""You are an expert ATS resume optimizer for graduate AI/ML positions.
-
-MY GENERIC CV CONTENT:
-{json.dumps(self.current_cv, indent=2)}
+DEFAULT_MODELS = {'tailoring': 'gemini-2.5-flash'}
+# Use as the 'analysis' model to score jobs locally (skill overlap) instead of with an LLM
+LOCAL_ANALYSIS = 'local'
 
-AVAILABLE PROJECT POOL (Select the best 2-3 for this job):
-{json.dumps(self.project_pool, indent=2)}
+# Bump whenever the prompt template or output format changes, so cached responses miss
+PROMPT_VERSION = 'tailor-v4'
 
-JOB I'M APPLYING TO:
-Title: {job['title']}
-Company: {job['company']}
-Location: {job['location']}
-URL: {job['url']}
+# Profile data goes into prompts without whitespace: indentation is pure token overhead
+COMPACT_JSON = {'separators': (',', ':'), 'ensure_ascii': False}
 
-FULL JOB DESCRIPTION:
-{job_description}
-
-YOUR TASK:
-Create a tailored version of my CV specifically for this job.
+TAILOR_INSTRUCTIONS = """You are an expert ATS resume optimizer for graduate AI/ML positions.
+For the job given at the end, create a tailored version of my CV specifically for that job.
 
 STEP 1: PROJECT SELECTION
 - Analyze the Job Description to identify the most relevant technical skills and domain requirements.
-- From the "AVAILABLE PROJECT POOL", select the 2 (or max 3) projects that BEST demonstrate these skills.
-- DO NOT use projects that are irrelevant if better options exist in the pool.
+- From the "CANDIDATE PROJECTS FOR THIS JOB", select the 2 (or max 3) projects that BEST demonstrate these skills.
+- DO NOT use projects that are irrelevant if better options exist among the candidates.
 - You may also use the experiences from the Generic CV if they are highly relevant.
 
 STEP 2: TAILORING
@@ -116,86 +48,962 @@ STEP 2: TAILORING
     - Use strong action verbs.
     - Highlight the specific technologies used (e.g., if JD asks for Next.js, emphasize Next.js usage in DocuCare).
 - **Experience**: Tailor the experience bullets similarly.
+"""
 
+# Full mode: the model returns the whole tailored CV
+FULL_OUTPUT_FORMAT = """
 OUTPUT FORMAT:
 Return ONLY valid JSON.
 
-{{
-  "job_analysis": {{
+{
+  "job_analysis": {
     "match_score": 85,
     "key_requirements": ["req1", "req2"],
     "selected_projects_reasoning": "Selected DocuCare because..."
-  }},
-  "tailored_cv": {{
-    "personal_info": {{ ... (same as generic) ... }},
+  },
+  "tailored_cv": {
+    "personal_info": { ... (same as generic) ... },
     "professional_summary": "...",
-    "skills": {{ ... }},
+    "skills": { ... },
     "experience": [ ... ],
     "projects": [
-      {{
+      {
         "title": "Title",
         "date": "Date",
         "technologies": ["tech1", "tech2"],
         "description": "One line summary",
         "achievements": ["bullet 1", "bullet 2", "bullet 3"]
-      }}
+      }
     ],
-    "education": {{ ... }},
+    "education": { ... },
     "certifications": [ ... ]
-  }}
-}}"""
+  }
+}
+"""
+
+# Delta mode: only what changes; unchanged sections are merged back locally from the generic CV
+DELTA_OUTPUT_FORMAT = """
+OUTPUT FORMAT (changes only - do NOT repeat personal info, education, certifications or anything unchanged):
+Return ONLY valid JSON.
+
+{
+  "job_analysis": {
+    "match_score": 85,
+    "key_requirements": ["req1", "req2"],
+    "selected_projects_reasoning": "Selected DocuCare because..."
+  },
+  "delta": {
+    "professional_summary": "...",
+    "skills_order": {"<skill category from my CV>": ["most relevant skill first", "..."]},
+    "projects": [
+      {"id": "<id of a candidate project>", "description": "One line summary", "achievements": ["bullet 1", "bullet 2", "bullet 3"]}
+    ],
+    "experience_bullets": {"<0-based index into my CV's experience list>": ["rewritten bullet", "..."]}
+  }
+}
+"""
+
+BATCH_INSTRUCTIONS = """
+BATCH MODE: several jobs follow, each introduced by a line "=== JOB <job_id> ===".
+Apply the task above to EACH job independently (never mix details between jobs).
+Return ONLY valid JSON of the form:
+{"results": [{"job_id": "<job_id>", "job_analysis": {...}, ...}, ...]}
+with exactly one entry per job: the single-job OUTPUT FORMAT object above plus its "job_id".
+"""
+
+REASK_INSTRUCTIONS = """
+REPAIR REQUEST: an earlier answer for this job had missing or invalid sections: {sections}.
+What it already contained (do not repeat it): {partial}
+Return ONLY valid JSON containing just those sections, nested exactly as in the OUTPUT FORMAT
+(e.g. {{"tailored_cv": {{"projects": [...]}}}} or {{"delta": {{"projects": [...]}}}}).
+"""
+
+ANALYSIS_PROMPT = """You screen graduate AI/ML job postings for one candidate.
+Score how well the candidate matches the job (0-100) and list the job's key requirements.
+
+CANDIDATE CV:
+{cv}
+
+CANDIDATE PROJECTS (titles and stacks):
+{projects}
+
+JOB: {title} at {company} ({location})
+{description}
+
+Return ONLY valid JSON:
+{{"job_analysis": {{"match_score": 0, "key_requirements": ["req1", "req2"], "selected_projects_reasoning": "best-fitting projects and why"}}}}
+"""
+ANALYSIS_OUTPUT_TOKENS = 200
+
+# Rough output size of one tailored CV, used to reserve tokens-per-minute quota up front
+EXPECTED_OUTPUT_TOKENS = 2500
 
+# Ends the title-only stand-in prompt used when a job's description can't be had
+TITLE_ONLY_MARKER = "(Full description could not be fetched)."
+REASK_OUTPUT_TOKENS = 600
+
+class CVGenerator:
+    def __init__(self, api_key, current_cv_path, project_pool_path=None,
+                 max_in_flight=1, rpm=30, tpm=None, llm_cache=None, project_top_k=5,
+                 context_cache=None, batch_size=1, stream=False, min_match_score=None,
+                 prescreen=False, token_budget=None, prefetch_depth=4, prefetch_workers=2, jd_store=None,
+                 models=None, analysis_threshold=60, output_mode='full', reuse_index=None,
+                 fetcher=None):
+        genai.configure(api_key=api_key)
+        
+        # Model per stage. With an 'analysis' model, routing is two-tier: every job
+        # is scored by the cheap model (or LOCAL_ANALYSIS, a local stand-in) and only
+        # jobs scoring >= analysis_threshold get the full tailoring call.
+        self.models = dict(DEFAULT_MODELS, **(models or {}))
+        self.model_name = self.models['tailoring']
+        self.model = genai.GenerativeModel(self.model_name)
+        self.analysis_model_name = self.models.get('analysis')
+        self.analysis_model = None
+        if self.analysis_model_name and self.analysis_model_name != LOCAL_ANALYSIS:
+            self.analysis_model = genai.GenerativeModel(self.analysis_model_name)
+        self.analysis_threshold = analysis_threshold
+        self.tier_stats = {
+            'analysis': {'calls': 0, 'tokens': 0, 'seconds': 0.0, 'passed': 0, 'rejected': 0},
+            'tailoring': {'calls': 0, 'tokens': 0, 'seconds': 0.0},
+        }
+        self.current_cv = self.load_json(current_cv_path)
+        self.project_pool = self.load_json(project_pool_path) if project_pool_path else []
+        self.http = get_client()
+        # JD pages go through an AsyncFetcher: per-host token buckets, plus AIMD rate
+        # control and circuit breakers when it's the scraper's (pass scraper.fetcher),
+        # so concurrent prefetch/prescreen can't hammer LinkedIn into 999s
+        self.fetcher = fetcher or AsyncFetcher(client=self.http, timeout=10)
+        # Optional JDStore: normalized descriptions reused across runs by canonical job ID
+        self.jd_store = jd_store
+        
+        # Concurrency: up to max_in_flight Gemini calls at once, admitted against
+        # requests-per-minute / tokens-per-minute quotas (None = unlimited).
+        # The default 30 RPM matches the old fixed 2s pause between jobs.
+        self.max_in_flight = max_in_flight
+        self.scheduler = QuotaScheduler(rpm=rpm, tpm=tpm)
+        
+        # Optional LLMResponseCache: identical (prompt version, model, CV, pool, JD) skips Gemini
+        self.llm_cache = llm_cache
+        
+        # Local BM25 pre-ranking of the project pool (built once per run): only the
+        # top-k projects for each JD are sent to Gemini
+        self.project_top_k = project_top_k
+        self.project_index = BM25Index([flatten_text(p) for p in self.project_pool]) if self.project_pool else None
+        # Pool entries as sent to the model, each with an id it can refer back to
+        self.project_pool_ids = with_project_ids(self.project_pool)
+        self.projects_by_id = {p['id']: p for p in self.project_pool_ids if isinstance(p, dict)}
+        # Size of the old layout (whole CV + pool, indent=2) for the tokens-saved report
+        self._full_profile_tokens = estimate_tokens(
+            json.dumps(self.current_cv, indent=2) + json.dumps(self.project_pool, indent=2)
+        )
+        self.prompt_stats = {'jobs': 0, 'tokens_saved': 0, 'cached_tokens': 0, 'aborted': 0, 'output_tokens_saved': 0,
+                             'jd_chars_removed': 0, 'jd_title_only': 0}
+        self._prompted_jobs = set()
+        self._stats_lock = threading.Lock()
+        # Schema validation / repair: local JSON repairs and section re-asks, and
+        # what they saved compared with retrying the whole call
+        self.repair_stats = {'json_repairs': 0, 'reasks': 0, 'reask_tokens': 0, 'repaired': 0,
+                             'failures': 0, 'tokens_saved': 0, 'seconds_saved': 0.0}
+        
+        # The prompt is a static prefix shared by every job plus a per-job suffix.
+        # With a ContextCache (Gemini cached content, or LocalContextCache in tests)
+        # the prefix is uploaded once and each request only carries the suffix.
+        self.context_cache = context_cache
+        # 'full': the model returns the whole tailored CV; 'delta': only the changes,
+        # merged locally onto current_cv (fewer output tokens, same result shape)
+        self.output_mode = output_mode
+        self.static_prefix = self._build_static_prefix()
+        
+        # Optional TailoringReuseIndex: a near-duplicate of an earlier job (repost,
+        # other location) reuses its result, if it was tailored for this same profile
+        self.reuse_index = reuse_index
+        self._profile_key = make_key(PROMPT_VERSION, self.model_name, self.output_mode, self.current_cv,
+                                     self.project_pool, self.project_top_k)
+        
+        # Jobs per Gemini request in generate_all_cvs (1 = one request per job)
+        self.batch_size = batch_size
+        
+        # Streaming mode: read job_analysis as it arrives and cancel the rest of
+        # the generation when match_score < min_match_score (single-job requests only)
+        self.stream = stream
+        self.min_match_score = min_match_score
+        
+        # Local relevance pre-screen: spend the LLM budget on the best-matching jobs
+        self.prescreen = prescreen
+        self.token_budget = token_budget
+        
+        # JD prefetch stage: up to prefetch_depth descriptions fetched ahead of generation (0 = off)
+        self.prefetch_depth = prefetch_depth
+        self.prefetch_workers = prefetch_workers
+        
+        # Skill vocabulary of the profile, for the local analysis stand-in
+        self._profile_skills = set(tokenize(flatten_text(self.current_cv.get('skills', {}) if isinstance(self.current_cv, dict) else {})))
+        for project in self.project_pool:
+            if isinstance(project, dict):
+                self._profile_skills.update(tokenize(flatten_text(project.get('technologies', []))))
+    
+    def load_json(self, path):
+        """Load JSON file content"""
+        if not path or not os.path.exists(path):
+            print(f"⚠️ Warning: File not found at {path}")
+            return [] if 'pool' in str(path) else {}
+        with open(path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    
+    def fetch_job_description(self, job_url, source):
+        """Fetch a job page with the shared pooled HTTP client and extract its description"""
         try:
-            print("  🤖 Calling Gemini API...")
-            response = self.model.generate_content(prompt, generation_config={"response_mime_type": "application/json"})
+            # Paced per host; repeat fetches are served/revalidated from the HTTP cache
+            response = self.fetcher.fetch_sync(job_url, cache_source='job_description')
             
-            response_text = response.text.replace('```json', '').replace('```', '').strip()
+            if response.status_code != 200:
+                print(f"  ⚠️ Status {response.status_code} fetching JD")
+                return ''
+            
+            # Per-domain extractors (src/utils/jd_extraction.py), then generic ones, then a <p> fallback
+            return extract_description(job_url, response.content)
             
-            tailored_cv_data = json.loads(response_text)
+        except Exception as e:
+            print(f"  ❌ Error fetching JD: {e}")
+            return ''
+    
+    def _resolve_job_description(self, job, verbose=True):
+        """
+        The job's normalized description: from the JD store, the listing itself,
+        or fetched (title-only fallback if none of those work)
+        """
+        job_description = self._lookup_job_description(job, verbose)
+        if job_description:
+            return job_description
+        if verbose:
+            print("  ⚠️  No job description found (or blocked), using title only...")
+        with self._stats_lock:
+            self.prompt_stats['jd_title_only'] += 1
+        return self._title_only_description(job)
+    
+    @staticmethod
+    def _title_only_description(job):
+        # Only ever used for this one prompt: never stored, never put on the job
+        return f"Job Title: {job['title']} at {job['company']}. Location: {job['location']}. {TITLE_ONLY_MARKER}"
+    
+    def _lookup_job_description(self, job, verbose=True):
+        """
+        The job's real normalized description (the listing's, stored, or fetched),
+        or '' when none could be had; only real descriptions go into the JD store
+        """
+        log = print if verbose else (lambda *args: None)
+        job_key = canonical_job_id(job.get('url'))
+        
+        # ATS sources deliver the description inline; only fetch when we don't have it
+        job_description = job.get('description', '')
+        stored = None
+        if not job_description and self.jd_store is not None and job_key:
+            stored = self.jd_store.get(job_key)
+            if stored and TITLE_ONLY_MARKER in stored:
+                # Placeholder saved by an older version: fetch the real JD again
+                stored = None
+        
+        if job_description:
+            log("  📄 Using job description already on hand (listing or prefetch)")
+        elif stored:
+            log(f"  📚 Using stored JD ({len(stored)} chars)")
+            return stored
+        else:
+            log("  📄 Fetching job description...")
+            job_description = self.fetch_job_description(job['url'], job['source'])
+        
+        # Boilerplate (EEO, cookies, benefits) and repeated sentences cost tokens and add nothing
+        raw_chars = len(job_description)
+        job_description = normalize_description(job_description)
+        with self._stats_lock:
+            self.prompt_stats['jd_chars_removed'] += raw_chars - len(job_description)
+        
+        if not job_description:
+            return ''
+        
+        log(f"  ✓ Got JD ({len(job_description)} chars, {raw_chars - len(job_description)} boilerplate chars dropped)")
+        if self.jd_store is not None:
+            self.jd_store.put(job_key, job_description)
+        return job_description
+    
+    def _result(self, job, job_description, tailored_cv_data, **extra):
+        """The per-job result dict saved by save_cv and consumed by main.py"""
+        result = {
+            'job': job,
+            'job_description': job_description,
+            'tailored_cv': tailored_cv_data,
+            'generated_at': datetime.now().isoformat()
+        }
+        result.update(extra)
+        return result
+    
+    def _cached_result(self, job, job_description, cache_key):
+        if self.llm_cache is None:
+            return None
+        cached = self.llm_cache.get(cache_key)
+        if cached is None:
+            return None
+        print(f"  🧠 Cached tailoring reused (no Gemini call). Match score: {cached['job_analysis']['match_score']}")
+        return self._result(job, job_description, cached, from_cache=True)
+    
+    def _reused_result(self, job, job_description):
+        if self.reuse_index is None:
+            return None
+        match = self.reuse_index.find(self._profile_key, job, job_description)
+        if match is None:
+            return None
+        data = patch_company(match['result'], match['company'], job.get('company'))
+        print(f"  ♻️  Near-duplicate of {match['title']} at {match['company']} ({match['similarity']:.0%} similar): "
+              f"tailoring reused (no Gemini call). Match score: {data['job_analysis']['match_score']}")
+        reused_from = {k: match[k] for k in ('title', 'company', 'url')}
+        reused_from['similarity'] = round(match['similarity'], 3)
+        return self._result(job, job_description, data, reused_from=reused_from)
+    
+    def _store(self, cache_key, tailored_cv_data, tokens=None, job=None, job_description=None):
+        if self.llm_cache is not None:
+            self.llm_cache.put(cache_key, tailored_cv_data, model=self.model_name, tokens=tokens)
+        if self.reuse_index is not None and job is not None:
+            self.reuse_index.add(self._profile_key, cache_key, job, job_description, tailored_cv_data)
+    
+    def _finish(self, job, job_description, cache_key, data, repaired, call_tokens, call_seconds, **extra):
+        """
+        Validate a (possibly locally repaired) answer against the result schema.
+        Invalid or missing sections are regenerated by a targeted re-ask instead
+        of repeating the whole call. Returns the result dict, or None.
+        """
+        schema = DELTA_RESULT if self.output_mode == 'delta' else TAILORED_CV_RESULT
+        data, problems = validate_result(data, schema)
+        reask_tokens = reask_seconds = 0
+        if problems:
+            if '' in problems:
+                print("  ❌ Model output is not a JSON object")
+                return None
+            data, reask_tokens, reask_seconds = self._reask_sections(job, job_description, data, problems, schema)
+            if data is None:
+                with self._stats_lock:
+                    self.repair_stats['failures'] += 1
+                return None
+        
+        if repaired or problems:
+            # What a full retry would have cost again, minus what the repair cost
+            with self._stats_lock:
+                self.repair_stats['repaired'] += 1
+                self.repair_stats['tokens_saved'] += max(0, call_tokens - reask_tokens)
+                self.repair_stats['seconds_saved'] += max(0.0, call_seconds - reask_seconds)
+        
+        if self.output_mode == 'delta':
+            tailored_cv, warnings = merge_delta(self.current_cv, self.projects_by_id, data['delta'],
+                                                fallback_projects=self.select_projects(job_description))
+            for warning in warnings:
+                print(f"  ⚠️ Delta merge: {warning}")
+            data = {'job_analysis': data['job_analysis'], 'tailored_cv': tailored_cv}
+        
+        print(f"  ✅ CV tailored! Match score: {data['job_analysis']['match_score']}")
+        self._store(cache_key, data, call_tokens + reask_tokens, job=job, job_description=job_description)
+        return self._result(job, job_description, data, **extra)
+    
+    def _finish_text(self, job, job_description, cache_key, text, call_tokens, call_seconds, **extra):
+        try:
+            data, repaired = repair_json(text)
+        except ValueError as e:
+            print(f"  ❌ Unusable model output: {e}")
+            with self._stats_lock:
+                self.repair_stats['failures'] += 1
+            return None
+        if repaired:
+            print("  🩹 Repaired malformed/truncated JSON locally")
+            with self._stats_lock:
+                self.repair_stats['json_repairs'] += 1
+        return self._finish(job, job_description, cache_key, data, repaired, call_tokens, call_seconds, **extra)
+    
+    def _reask_sections(self, job, job_description, data, sections, schema=TAILORED_CV_RESULT):
+        """Ask only for the broken sections and patch them in; returns (data or None, tokens, seconds)"""
+        print(f"  🔧 Re-asking for {len(sections)} section(s): {', '.join(sections)}")
+        prompt = self._build_prompt(job, job_description) + REASK_INSTRUCTIONS.format(
+            sections=', '.join(sections),
+            partial=json.dumps(data, **COMPACT_JSON)
+        )
+        started = time.time()
+        try:
+            response = self._call_model(prompt, prefix=self.static_prefix,
+                                        expected_output_tokens=REASK_OUTPUT_TOKENS * len(sections),
+                                        generation_config={"response_mime_type": "application/json"})
+            patch, _ = repair_json(response.text)
+        except Exception as e:
+            print(f"  ❌ Re-ask failed: {e}")
+            return None, 0, 0.0
+        seconds = time.time() - started
+        tokens = self._usage_tokens(response, prompt, response.text)
+        with self._stats_lock:
+            self.repair_stats['reasks'] += 1
+            self.repair_stats['reask_tokens'] += tokens
+        
+        for section in sections:
+            value = get_section(patch, section)
+            if value is not None:
+                set_section(data, section, value)
+        data, problems = validate_result(data, schema)
+        if problems:
+            print(f"  ❌ Still invalid after re-ask: {', '.join(problems)}")
+            return None, tokens, seconds
+        return data, tokens, seconds
+    
+    def _usage_tokens(self, response, prompt, text):
+        """Billed tokens from usage_metadata, or a local estimate when there is none"""
+        usage = getattr(response, 'usage_metadata', None)
+        total = getattr(usage, 'total_token_count', None) if usage else None
+        return total or estimate_tokens(self.static_prefix + prompt) + estimate_tokens(text)
+    
+    def local_analysis(self, job_description):
+        """
+        Local stand-in for the analysis tier: the share of the profile's skill
+        vocabulary (CV skills + project stacks) the JD asks for, where ten or
+        more matching skills counts as a full match
+        """
+        jd_terms = set(tokenize(job_description))
+        matched = sorted(self._profile_skills & jd_terms)
+        score = int(min(100, round(100 * len(matched) / max(1, min(10, len(self._profile_skills))))))
+        return {
+            'match_score': score,
+            'key_requirements': matched,
+            'selected_projects_reasoning': 'Local skill-overlap estimate'
+        }
+    
+    def analyze_job(self, job, job_description):
+        """job_analysis from the cheap tier (LLM or local), or None if it couldn't be produced"""
+        if self.analysis_model is None:
+            started = time.time()
+            analysis = self.local_analysis(job_description)
+            self._record_tier('analysis', started, None)
+            return analysis
+        
+        projects = [
+            {'title': p.get('title') or p.get('name'), 'technologies': p.get('technologies', [])}
+            for p in self.select_projects(job_description) if isinstance(p, dict)
+        ]
+        prompt = ANALYSIS_PROMPT.format(
+            cv=json.dumps(self.current_cv, **COMPACT_JSON),
+            projects=json.dumps(projects, **COMPACT_JSON),
+            title=job['title'], company=job['company'], location=job['location'],
+            description=job_description
+        )
+        try:
+            response = self._call_model(prompt, tier='analysis', expected_output_tokens=ANALYSIS_OUTPUT_TOKENS,
+                                        generation_config={"response_mime_type": "application/json"})
+            data, _ = repair_json(response.text)
+        except Exception as e:
+            print(f"  ⚠️ Analysis tier failed ({e}), sending the job straight to tailoring")
+            return None
+        analysis = data.get('job_analysis', data) if isinstance(data, dict) else None
+        analysis, problems = validate_result({'job_analysis': analysis}, ANALYSIS_RESULT)
+        return None if problems else analysis['job_analysis']
+    
+    def _passes_analysis(self, job, job_description):
+        """Two-tier routing gate: True if the job should get the (expensive) tailoring call"""
+        if not self.analysis_model_name:
+            return True
+        analysis = self.analyze_job(job, job_description)
+        if analysis is None:
+            return True
+        passed = analysis['match_score'] >= self.analysis_threshold
+        with self._stats_lock:
+            self.tier_stats['analysis']['passed' if passed else 'rejected'] += 1
+        verdict = "→ tailoring" if passed else f"below {self.analysis_threshold}, skipped"
+        print(f"  🔬 Analysis ({self.analysis_model_name}): match score {analysis['match_score']} {verdict}")
+        return passed
+    
+    def generate_tailored_cv(self, job, job_description=None, skip_analysis=False):
+        """Generate tailored CV using Gemini API (skip_analysis: the caller already routed the job)"""
+        
+        print(f"\n🎯 Tailoring CV for: {job['title']} at {job['company']}")
+        
+        if job_description is None:
+            job_description = self._resolve_job_description(job)
+        
+        cache_key = self._cache_key(job_description)
+        cached = self._cached_result(job, job_description, cache_key) or self._reused_result(job, job_description)
+        if cached is not None:
+            return cached
+        
+        if not skip_analysis and not self._passes_analysis(job, job_description):
+            return None
+        
+        prompt = self._build_prompt(job, job_description)
+
+        try:
+            if self.stream:
+                return self._generate_streaming(job, job_description, prompt, cache_key)
             
-            print(f"  ✅ CV tailored! Match score: {tailored_cv_data['job_analysis']['match_score']}")
+            print("  🤖 Calling Gemini API...")
+            started = time.time()
+            response = self._call_model(prompt, prefix=self.static_prefix,
+                                        generation_config={"response_mime_type": "application/json"})
             
-            return {
-                'job': job,
-                'job_description': job_description,
-                'tailored_cv': tailored_cv_data,
-                'generated_at': datetime.now().isoformat()
-            }
+            return self._finish_text(job, job_description, cache_key, response.text,
+                                     self._usage_tokens(response, prompt, response.text), time.time() - started)
             
         except Exception as e:
             print(f"  ❌ Error generating CV: {e}")
             return None
     
-    def generate_all_cvs(self, job_links, max_cvs=100):
-        """Generate tailored CVs for all job links"""
+    def _generate_streaming(self, job, job_description, prompt, cache_key):
+        """
+        Stream the response and read job_analysis as soon as it is complete (it
+        comes first in the output format). If its match_score is below
+        min_match_score the generation is cancelled and the job is skipped,
+        so the tailored CV for a poor match is never paid for.
+        """
+        scanner = ObjectMemberScanner(keys=('job_analysis',))
+        low_score = []
         
-        print(f"\n🎨 Starting CV generation for {len(job_links)} jobs...")
+        def on_text(text):
+            for _, analysis in scanner.feed(text):
+                # Same coercion as the final validation: "85", "85%" and 85.0 all mean 85
+                analysis, problems = JOB_ANALYSIS.check(analysis, 'job_analysis')
+                score = analysis.get('match_score') if isinstance(analysis, dict) else None
+                if 'job_analysis.match_score' in problems:
+                    score = None
+                print(f"  📊 Match score {score} (streamed ahead of the CV)")
+                if (self.min_match_score is not None and isinstance(score, (int, float))
+                        and score < self.min_match_score):
+                    low_score.append(score)
+                    return False
+            return True
+        
+        print("  🤖 Streaming from Gemini API...")
+        started = time.time()
+        text, stopped = self._stream_model(prompt, on_text, prefix=self.static_prefix,
+                                           generation_config={"response_mime_type": "application/json"})
+        if stopped:
+            saved = max(0, EXPECTED_OUTPUT_TOKENS - estimate_tokens(text))
+            with self._stats_lock:
+                self.prompt_stats['aborted'] += 1
+                self.prompt_stats['output_tokens_saved'] += saved
+            print(f"  ⏹️  Below min match score {self.min_match_score}: generation cancelled (~{saved} output tokens saved)")
+            return None
+        
+        return self._finish_text(job, job_description, cache_key, text,
+                                 self._usage_tokens(None, prompt, text), time.time() - started)
+    
+    def prefetch_descriptions(self, jobs, workers=8):
+        """Look up every job's JD concurrently (rate-limited fetcher + caches); in job order, '' where none was found"""
+        if not jobs:
+            return []
+        with ThreadPoolExecutor(max_workers=min(workers, len(jobs)), thread_name_prefix='jd') as executor:
+            return list(executor.map(lambda job: self._lookup_job_description(job, verbose=False), jobs))
+    
+    @staticmethod
+    def _with_description(job, job_description, **extra):
+        """
+        Copy of job carrying its prefetched description. Without one it is flagged
+        description_missing instead, so generation retries the fetch rather than
+        treating a placeholder as the JD.
+        """
+        job = dict(job, **extra)
+        if job_description:
+            job['description'] = job_description
+        else:
+            job['description_missing'] = True
+        return job
+    
+    def prescreen_jobs(self, jobs, top_n, token_budget=None):
+        """
+        Cheap local relevance pass over ALL jobs before any Gemini call: BM25 of
+        the profile (generic CV + project pool) against each JD, as one NumPy
+        matrix. Jobs are taken best-first until top_n or the estimated token
+        budget is reached. Returns copies of the kept jobs with 'description'
+        (the resolved JD, or 'description_missing') and 'relevance_score' (0-100,
+        relative to the best) set.
+        """
+        print(f"\n🔎 Pre-screening {len(jobs)} jobs locally...")
+        started = time.time()
+        found = self.prefetch_descriptions(jobs)
+        # Jobs without a JD are still ranked (on their title-only prompt)
+        descriptions = [jd or self._title_only_description(job) for job, jd in zip(jobs, found)]
         
+        profile = flatten_text(self.current_cv) + ' ' + flatten_text(self.project_pool)
+        scores = BM25Index(descriptions).scores(profile)
+        best = float(scores.max()) if len(scores) and scores.max() > 0 else 1.0
+        
+        # Priority only breaks ties between equally relevant jobs
+        order = sorted(range(len(jobs)), key=lambda k: (-float(scores[k]), not jobs[k].get('priority', False)))
+        prefix_tokens = 0 if self.context_cache is not None else estimate_tokens(self.static_prefix)
+        kept = []
+        spent = 0
+        for k in order:
+            if len(kept) >= top_n:
+                break
+            cost = prefix_tokens + estimate_tokens(descriptions[k]) + EXPECTED_OUTPUT_TOKENS
+            if token_budget is not None and spent + cost > token_budget:
+                continue
+            spent += cost
+            job = self._with_description(jobs[k], found[k], relevance_score=round(100.0 * float(scores[k]) / best, 1))
+            kept.append(job)
+        
+        print(f"  ✓ Kept {len(kept)}/{len(jobs)} jobs (~{spent} tokens) in {time.time() - started:.1f}s")
+        for job in kept:
+            print(f"    {job['relevance_score']:5.1f}  {job['title']} at {job['company']}")
+        return kept
+    
+    def generate_batch(self, items):
+        """
+        Tailor several jobs with ONE Gemini request: the static prefix once, then
+        every job's suffix tagged with an ID, answered as {"results": [...]}.
+        `items` are (index, job) pairs; returns (index, result-or-None) pairs.
+        Items missing from (or invalid in) the batch answer are retried one by one.
+        """
+        print(f"\n📦 Batch of {len(items)} jobs: {', '.join(job['company'] for _, job in items)}")
         results = []
+        pending = []
+        for i, job in items:
+            print(f"\n🎯 [{i}] {job['title']} at {job['company']}")
+            job_description = self._resolve_job_description(job)
+            cache_key = self._cache_key(job_description)
+            cached = self._cached_result(job, job_description, cache_key) or self._reused_result(job, job_description)
+            if cached is not None:
+                results.append((i, cached))
+            elif not self._passes_analysis(job, job_description):
+                results.append((i, None))
+            else:
+                pending.append((i, job, job_description, cache_key))
+        
+        if len(pending) == 1:
+            i, job, job_description, _ = pending[0]
+            return results + [(i, self.generate_tailored_cv(job, job_description=job_description, skip_analysis=True))]
+        if not pending:
+            return results
+        
+        prompt = BATCH_INSTRUCTIONS + ''.join(
+            f"\n=== JOB job_{i} ===\n{self._build_prompt(job, job_description)}"
+            for i, job, job_description, _ in pending
+        )
+        answers = {}
+        tokens = 0
+        seconds = 0.0
+        try:
+            print(f"  🤖 Calling Gemini API with {len(pending)} jobs in one request...")
+            started = time.time()
+            response = self._call_model(prompt, prefix=self.static_prefix,
+                                        expected_output_tokens=EXPECTED_OUTPUT_TOKENS * len(pending),
+                                        generation_config={"response_mime_type": "application/json"})
+            # A batch answer cut off by the output limit still yields its complete items
+            batch, repaired = repair_json(response.text)
+            if repaired:
+                print("  🩹 Repaired malformed/truncated batch JSON locally")
+            for item in batch.get('results', []) if isinstance(batch, dict) else []:
+                if isinstance(item, dict) and item.get('job_id'):
+                    answers[str(item.pop('job_id'))] = item
+            tokens = self._usage_tokens(response, prompt, response.text) // len(pending)
+            seconds = (time.time() - started) / len(pending)
+        except Exception as e:
+            print(f"  ❌ Batch request failed: {e}")
+        
+        for i, job, job_description, cache_key in pending:
+            answer = answers.get(f"job_{i}")
+            result = None
+            if answer is not None:
+                print(f"  [{i}] {job['company']}:")
+                result = self._finish(job, job_description, cache_key, answer, False, tokens, seconds, batched=True)
+            if result is None:
+                print(f"  🔁 [{i}] {job['company']} missing or unusable in the batch answer, retrying on its own")
+                result = self.generate_tailored_cv(job, job_description=job_description, skip_analysis=True)
+            results.append((i, result))
+        return results
+    
+    def select_projects(self, job_description):
+        """Top-k pool projects for this JD by BM25 score (the whole pool if it's already small)"""
+        if self.project_index is None or len(self.project_pool) <= self.project_top_k:
+            return list(self.project_pool_ids)
+        order, _ = self.project_index.top_k(job_description, self.project_top_k)
+        return [self.project_pool_ids[i] for i in order]
+    
+    def _build_static_prefix(self):
+        """
+        Everything that is identical for every job in a run: instructions, output
+        format and the generic CV, plus the whole project pool when a context
+        cache holds the prefix (cached tokens are cheap, so no need to shortlist)
+        """
+        output_format = DELTA_OUTPUT_FORMAT if self.output_mode == 'delta' else FULL_OUTPUT_FORMAT
+        prefix = TAILOR_INSTRUCTIONS + output_format + f"""
+MY GENERIC CV CONTENT:
+{json.dumps(self.current_cv, **COMPACT_JSON)}
+"""
+        if self.context_cache is not None:
+            prefix += f"""
+MY PROJECT POOL:
+{json.dumps(self.project_pool_ids, **COMPACT_JSON)}
+"""
+        return prefix
+    
+    def _build_prompt(self, job, job_description):
+        """Per-job suffix: the JD and its project shortlist (titles only if the pool is in the cached prefix)"""
+        projects = self.select_projects(job_description)
+        if self.context_cache is not None:
+            candidates = json.dumps([{'id': p.get('id'), 'title': p.get('title') or p.get('name')} for p in projects],
+                                    **COMPACT_JSON)
+        else:
+            candidates = json.dumps(projects, **COMPACT_JSON)
+        
+        prompt = f"""
+CANDIDATE PROJECTS FOR THIS JOB (pre-ranked; select the best 2-3):
+{candidates}
+
+JOB I'M APPLYING TO:
+Title: {job['title']}
+Company: {job['company']}
+Location: {job['location']}
+URL: {job['url']}
+
+FULL JOB DESCRIPTION:
+{job_description}
+"""
+        
+        # Compared with the old layout, which resent the whole CV and pool (indent=2) for every job
+        saved = max(0, self._full_profile_tokens - estimate_tokens(candidates) - (
+            0 if self.context_cache is not None else estimate_tokens(json.dumps(self.current_cv, **COMPACT_JSON))
+        ))
+        # Re-asks and batch retries rebuild the same job's prompt: count each job once
+        job_key = (job.get('url'), job['title'], job['company'])
+        with self._stats_lock:
+            counted = job_key in self._prompted_jobs
+            if not counted:
+                self._prompted_jobs.add(job_key)
+                self.prompt_stats['jobs'] += 1
+                self.prompt_stats['tokens_saved'] += saved
+        if not counted:
+            print(f"  ✂️  Prompt: {len(projects)}/{len(self.project_pool)} projects, ~{saved} tokens saved")
+        return prompt
+    
+    def _cache_key(self, job_description):
+        return make_key(PROMPT_VERSION, self.model_name, self.output_mode, self.current_cv, self.project_pool,
+                        self.project_top_k, normalize_text(job_description))
+    
+    def _model_for(self, prompt, prefix, tier='tailoring'):
+        """
+        With a context cache the static prefix is already on the server and only
+        `prompt` is sent; otherwise prefix + prompt go inline.
+        """
+        if tier == 'analysis':
+            return self.analysis_model, prefix + prompt
+        model = self.context_cache.model_for(self.model_name, prefix) if prefix and self.context_cache else None
+        if model is None:
+            return self.model, prefix + prompt
+        return model, prompt
+    
+    def _record_tier(self, tier, started, usage):
+        with self._stats_lock:
+            stats = self.tier_stats[tier]
+            stats['calls'] += 1
+            stats['seconds'] += time.time() - started
+            stats['tokens'] += (getattr(usage, 'total_token_count', None) if usage else None) or 0
+    
+    def _record_usage(self, reservation, usage):
+        self.scheduler.settle(reservation, getattr(usage, 'total_token_count', None) if usage else None)
+        cached_tokens = getattr(usage, 'cached_content_token_count', None) if usage else None
+        if cached_tokens:
+            with self._stats_lock:
+                self.prompt_stats['cached_tokens'] += cached_tokens
+    
+    def _call_model(self, prompt, prefix='', expected_output_tokens=EXPECTED_OUTPUT_TOKENS, tier='tailoring', **kwargs):
+        """generate_content() behind the RPM/TPM scheduler"""
+        model, prompt = self._model_for(prompt, prefix, tier)
+        reservation = self.scheduler.acquire(estimate_tokens(prompt) + expected_output_tokens)
+        response = None
+        started = time.time()
+        try:
+            response = model.generate_content(prompt, **kwargs)
+            return response
+        finally:
+            usage = getattr(response, 'usage_metadata', None)
+            self._record_usage(reservation, usage)
+            self._record_tier(tier, started, usage)
+    
+    def _stream_model(self, prompt, on_text, prefix='', expected_output_tokens=EXPECTED_OUTPUT_TOKENS, **kwargs):
+        """
+        Streaming generate_content(): on_text(chunk_text) is called as chunks
+        arrive and may return False to stop generation. Returns (text, stopped).
+        """
+        model, prompt = self._model_for(prompt, prefix)
+        reservation = self.scheduler.acquire(estimate_tokens(prompt) + expected_output_tokens)
+        started = time.time()
+        parts = []
+        usage = None
+        stopped = False
+        response = None
+        try:
+            response = model.generate_content(prompt, stream=True, **kwargs)
+            for chunk in response:
+                usage = getattr(chunk, 'usage_metadata', None) or usage
+                parts.append(chunk.text)
+                if on_text(chunk.text) is False:
+                    stopped = True
+                    break
+        finally:
+            if stopped and response is not None:
+                # Stop consuming and release the stream, so the server stops generating
+                iterator = getattr(response, '_iterator', None)
+                close = getattr(iterator, 'cancel', None) or getattr(iterator, 'close', None)
+                if close:
+                    close()
+            self._record_usage(reservation, usage)
+            self._record_tier('tailoring', started, usage)
+        return ''.join(parts), stopped
+    
+    def _prefetch_one(self, item):
+        """Pipeline producer: (index, job) -> (index, copy of job with its description, see _with_description)"""
+        i, job = item
+        return i, self._with_description(job, self._lookup_job_description(job, verbose=False))
+    
+    @staticmethod
+    def _prefetched(results):
+        """(index, job) pairs from the prefetch stage; a job whose prefetch failed goes on unchanged"""
+        for item, result in results:
+            if isinstance(result, Exception):
+                i, job = item
+                print(f"  ⚠️ [{i}] JD prefetch failed for {job['company']} ({result}); resolving it at generation time")
+                yield item
+            else:
+                yield result
+    
+    @staticmethod
+    def _chunks(items, size):
+        chunk = []
+        for item in items:
+            chunk.append(item)
+            if len(chunk) == size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+    
+    def _generate_one(self, unit):
+        (i, job), = unit
+        print(f"\n[{i}] Processing: {job['title']} at {job['company']}")
+        return [(i, self.generate_tailored_cv(job))]
+    
+    def generate_all_cvs(self, job_links, max_cvs=100, max_in_flight=None, batch_size=None, token_budget=None):
+        """
+        Generate tailored CVs for all job links.
+        With max_in_flight > 1, jobs are tailored concurrently and results come
+        back in completion order; saved filenames still use each job's position
+        in the prioritised list, so they're deterministic.
+        With batch_size > 1, that many jobs share one Gemini request (bulk runs:
+        fewer requests and one copy of the prompt prefix per batch).
+        With prescreen enabled, the jobs to tailor are the max_cvs most relevant
+        ones (local scoring, within token_budget) instead of the first max_cvs.
+        """
         
-        # Prioritize high-priority jobs
-        priority_jobs = [j for j in job_links if j.get('priority', False)]
-        other_jobs = [j for j in job_links if not j.get('priority', False)]
+        print(f"\n🎨 Starting CV generation for {len(job_links)} jobs...")
         
-        all_jobs = priority_jobs + other_jobs
-        all_jobs = all_jobs[:max_cvs]  # Limit total
+        max_in_flight = max_in_flight or self.max_in_flight
+        batch_size = batch_size or self.batch_size
+        results = []
         
-        for i, job in enumerate(all_jobs, 1):
-            print(f"\n[{i}/{len(all_jobs)}] Processing: {job['title']} at {job['company']}")
+        token_budget = token_budget or self.token_budget
+        if self.prescreen:
+            all_jobs = self.prescreen_jobs(job_links, max_cvs, token_budget)
+        else:
+            # Prioritize high-priority jobs
+            priority_jobs = [j for j in job_links if j.get('priority', False)]
+            other_jobs = [j for j in job_links if not j.get('priority', False)]
             
-            cv_data = self.generate_tailored_cv(job)
+            all_jobs = priority_jobs + other_jobs
+            all_jobs = all_jobs[:max_cvs]  # Limit total
+        
+        # Stage 1: JD prefetch runs ahead of generation into a bounded queue, so
+        # network waits overlap with model waits (prescreen already fetched them all)
+        indexed = enumerate(all_jobs, 1)
+        pipeline = None
+        if self.prefetch_depth > 0 and not self.prescreen:
+            pipeline = PrefetchPipeline(self._prefetch_one, depth=self.prefetch_depth,
+                                        workers=self.prefetch_workers, name='JD prefetch')
+            indexed = self._prefetched(pipeline.run(indexed))
+        
+        # Stage 2: units of work (single jobs, or batches of (index, job) pairs) as they become ready
+        if batch_size > 1:
+            units = self._chunks(indexed, batch_size)
+            run = self.generate_batch
+        else:
+            units = ([item] for item in indexed)
+            run = self._generate_one
+        
+        if max_in_flight <= 1:
+            for unit in units:
+                # Rate limiting (avoid hitting API limits) is handled by self.scheduler
+                try:
+                    unit_results = run(unit)
+                except Exception as e:
+                    print(f"  ❌ Jobs {[i for i, _ in unit]} failed: {e}")
+                    continue
+                for i, cv_data in unit_results:
+                    if cv_data:
+                        results.append(cv_data)
+                        
+                        # Save individual CV
+                        self.save_cv(cv_data, i)
+        else:
+            print(f"  ⚡ Running up to {max_in_flight} Gemini requests in flight")
+            done = 0
             
-            if cv_data:
-                results.append(cv_data)
-                
-                # Save individual CV
-                self.save_cv(cv_data, i)
+            def collect(finished):
+                nonlocal done
+                for future in finished:
+                    try:
+                        unit_results = future.result()
+                    except Exception as e:
+                        print(f"  ❌ Jobs {[i for i, _ in futures.pop(future)]} failed: {e}")
+                        continue
+                    futures.pop(future)
+                    for i, cv_data in unit_results:
+                        done += 1
+                        print(f"  [{done}/{len(all_jobs)}] Finished job {i}")
+                        if cv_data:
+                            results.append(cv_data)
+                            self.save_cv(cv_data, i)
             
-            # Rate limiting (avoid hitting API limits)
-            if i < len(all_jobs):
-                time.sleep(2)
+            with ThreadPoolExecutor(max_workers=max_in_flight, thread_name_prefix='cv') as executor:
+                futures = {}
+                for unit in units:
+                    # Only pull more prefetched JDs when a generation slot is free
+                    if len(futures) >= max_in_flight:
+                        collect(wait(futures, return_when=FIRST_COMPLETED).done)
+                    futures[executor.submit(run, unit)] = unit
+                collect(as_completed(list(futures)))
         
         print(f"\n✅ Generated {len(results)} tailored CVs!")
+        quota = self.scheduler.stats
+        print(f"   Gemini requests: {quota['requests']}  Tokens: {quota['tokens']}  Quota wait: {quota['waited_seconds']:.1f}s")
+        if self.prompt_stats['jobs']:
+            print(f"   Prompt tokens saved vs. resending the full CV + pool: ~{self.prompt_stats['tokens_saved']} "
+                  f"({self.prompt_stats['tokens_saved'] // self.prompt_stats['jobs']} per job)")
+        if self.prompt_stats['jd_title_only']:
+            print(f"   ⚠️  {self.prompt_stats['jd_title_only']} job(s) had no fetchable description "
+                  f"(blocked, throttled or paused host): tailored from the title only")
+        if self.prompt_stats['jd_chars_removed']:
+            print(f"   JD boilerplate removed: ~{self.prompt_stats['jd_chars_removed'] // 4} tokens")
+        if self.analysis_model_name:
+            for tier in ('analysis', 'tailoring'):
+                stats = self.tier_stats[tier]
+                model = self.analysis_model_name if tier == 'analysis' else self.model_name
+                avg = stats['seconds'] / stats['calls'] if stats['calls'] else 0.0
+                line = f"   Tier {tier} ({model}): {stats['calls']} calls, {stats['tokens']} tokens, avg {avg:.2f}s"
+                if tier == 'analysis':
+                    line += f"; {stats['passed']} passed, {stats['rejected']} rejected"
+                print(line)
+        if self.repair_stats['repaired'] or self.repair_stats['failures']:
+            repair = self.repair_stats
+            print(f"   Repaired answers: {repair['repaired']} ({repair['json_repairs']} JSON fixes, {repair['reasks']} "
+                  f"section re-asks, {repair['failures']} unrecoverable); vs full retries saved "
+                  f"~{repair['tokens_saved']} tokens, {repair['seconds_saved']:.1f}s")
+        if self.prompt_stats['aborted']:
+            print(f"   Early-aborted low matches: {self.prompt_stats['aborted']} "
+                  f"(~{self.prompt_stats['output_tokens_saved']} output tokens saved)")
+        if self.context_cache is not None:
+            cache_stats = self.context_cache.stats
+            print(f"   Context cache: {cache_stats['uploads']} prefix upload(s), {cache_stats['requests']} requests, "
+                  f"{self.prompt_stats['cached_tokens']} cached input tokens")
+        if pipeline is not None:
+            pipeline.print_stats()
         return results
     
     def save_cv(self, cv_data, index):
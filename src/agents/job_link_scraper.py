@@ -1,62 +1,98 @@
 # src/agents/job_link_scraper.py
 
 import json
-import requests
+import asyncio
 from bs4 import BeautifulSoup
-import time
 from datetime import datetime
 import os
-import random
+from src.agents.ats_ingestor import ATSIngestor
+from src.utils.async_fetcher import AsyncFetcher, HostRateLimiter
+from src.utils.http_client import get_client
+from src.utils.job_identity import canonical_job_id, company_key, job_shingles, NearDuplicateDetector
+from src.utils.linkedin_parser import parse_job_cards
+from src.utils.rate_control import AdaptiveRateController, CircuitBreakerRegistry
+from src.utils.source_scheduler import SourceScheduler
+from src.utils.title_classifier import classify_title, classify_titles, REASON_BLACKLIST
 
 class JobLinkScraper:
-    def __init__(self):
+    def __init__(self, seen_index=None, enabled_sources=None):
         self.priority_roles = [
             "AI Intern",
             "AI Research Intern"
         ]
         self.secondary_roles = []
         self.job_links = []
-        self.headers = {
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+        # Shared pooled client (keep-alive, compression, retries, default headers)
+        self.http = get_client()
+        
+        # Per-host token buckets replace the fixed sleeps between pages/roles.
+        # (rate in requests/sec, burst size)
+        self.rate_limiter = HostRateLimiter(
+            default_rate=2.0,
+            default_burst=4,
+            host_limits={
+                'www.linkedin.com': (1.0, 3),
+            }
+        )
+        # AIMD tuning of those rates from 429/999s and latency, up to a per-host ceiling,
+        # plus a circuit breaker per host that pauses failing sources for a cool-down
+        self.rate_controller = AdaptiveRateController(
+            self.rate_limiter,
+            max_rates={
+                'www.linkedin.com': 3.0,
+            }
+        )
+        self.breakers = CircuitBreakerRegistry(failure_threshold=5, cooldown=300)
+        self.fetcher = AsyncFetcher(
+            self.rate_limiter,
+            client=self.http,
+            max_concurrency=8,
+            timeout=10,
+            rate_controller=self.rate_controller,
+            breakers=self.breakers
+        )
+        
+        # Greenhouse/Lever boards to track (see ATSIngestor for defaults)
+        self.ats_ingestor = ATSIngestor(client=self.http, breakers=self.breakers)
+        
+        # Results page parser: 'lxml' (fast, default when installed) or 'bs4'
+        self.parser_backend = None
+        
+        # Sources run in parallel by the SourceScheduler, each with a wall-clock deadline (seconds)
+        self.source_deadlines = {
+            'linkedin': 180,
+            'startups': 30,
+            'company_careers': 60,
+            'ats_boards': 60,
+            'graduate_schemes': 30,
+            'tech_boards': 30,
         }
+        self.enabled_sources = list(enabled_sources or ['linkedin'])
+        self.source_report = {}
+        
+        # Estimated Jaccard similarity above which two postings count as the same job
+        self.near_duplicate_threshold = 0.7
+        
+        # Optional persistent SeenJobsIndex for incremental runs
+        self.seen_index = seen_index
+        self.new_job_ids = set()
+        self._pending_seen = []
     
     def scrape_all_platforms(self):
         """Main orchestrator - scrapes ALL sources for all roles"""
         print("🔍 Starting COMPREHENSIVE job link scraping...")
         
-        all_jobs = []
-        
-        # 1. LinkedIn (Priority - Last 24h)
-        print("\n=== 1️⃣ LinkedIn Jobs (Last 24h) ===")
-        for role in self.priority_roles:
-            jobs = self.search_linkedin_advanced(role, hours_old=24)
-            all_jobs.extend(jobs)
-            time.sleep(random.uniform(2, 5))
-
-        # 2. Startup Boards
-        # print("\n=== 2️⃣ Startup Job Boards ===")
-        # for role in self.priority_roles:
-        #     all_jobs.extend(self.search_startups(role))
-        #     time.sleep(2)
-            
-        # 3. Company Career Pages & ATS
-        # print("\n=== 3️⃣ Company Career Pages & ATS ===")
-        # Search companies once generally or per role? 
-        # Better to search once to avoid spamming the same sites
-        # all_jobs.extend(self.search_company_careers())
-        
-        # ATS search is per keyword usually, or just dumping all jobs
-        # all_jobs.extend(self.search_ats_boards())
-        
-        # 4. Graduate Schemes
-        # print("\n=== 4️⃣ Graduate Schemes ===")
-        # all_jobs.extend(self.search_graduate_schemes())
+        scheduler = SourceScheduler(max_workers=len(self.source_deadlines))
+        sources = self.get_sources()
+        for name in self.enabled_sources:
+            if name not in sources:
+                print(f"  ⚠️ Unknown source '{name}', skipping")
+                continue
+            scheduler.register(name, sources[name], deadline=self.source_deadlines.get(name, 60))
         
-        # 5. Tech Boards
-        # print("\n=== 5️⃣ Tech-Specific Boards ===")
-        # for role in self.priority_roles:
-        #     all_jobs.extend(self.search_tech_boards(role))
-        #     time.sleep(1)
+        print(f"\n=== Running {len(scheduler.sources)} sources in parallel: {', '.join(s.name for s in scheduler.sources)} ===")
+        all_jobs = scheduler.run()
+        self.source_report = scheduler.report
         
         # Remove duplicates
         unique_jobs = self.remove_duplicates(all_jobs)
@@ -64,10 +100,37 @@ class JobLinkScraper:
         # Filter relevant jobs
         relevant_jobs = self.filter_jobs(unique_jobs)
         
+        if self.seen_index is not None:
+            self._update_seen_index(relevant_jobs)
+        
         self.print_summary(relevant_jobs)
         
         return relevant_jobs
 
+    def get_sources(self):
+        """Source plugins: name -> fn(cancel_event) returning job dicts"""
+        return {
+            # 1. LinkedIn (Priority - Last 24h)
+            'linkedin': lambda cancel: self.search_linkedin_roles(self.priority_roles, hours_old=24, cancel_event=cancel),
+            # 2. Startup Boards
+            'startups': lambda cancel: self._per_role(self.search_startups, cancel),
+            # 3. Company Career Pages & ATS (searched once, not per role, to avoid spamming the same sites)
+            'company_careers': lambda cancel: self.search_company_careers(cancel_event=cancel),
+            'ats_boards': lambda cancel: self.search_ats_boards(cancel_event=cancel),
+            # 4. Graduate Schemes
+            'graduate_schemes': lambda cancel: self.search_graduate_schemes(),
+            # 5. Tech Boards
+            'tech_boards': lambda cancel: self._per_role(self.search_tech_boards, cancel),
+        }
+    
+    def _per_role(self, search_fn, cancel_event):
+        jobs = []
+        for role in self.priority_roles:
+            if cancel_event.is_set():
+                break
+            jobs.extend(search_fn(role))
+        return jobs
+
     def search_startups(self, role):
         """Search Startup Job Boards"""
         jobs = []
@@ -76,7 +139,7 @@ class JobLinkScraper:
         # Y Combinator
         try:
             url = "https://www.ycombinator.com/jobs"
-            resp = requests.get(url, headers=self.headers, timeout=10)
+            resp = self.fetcher.fetch_sync(url)
             if resp.status_code == 200:
                 soup = BeautifulSoup(resp.content, 'html.parser')
                 # YC structure changes often, looking for generic match
@@ -106,7 +169,7 @@ class JobLinkScraper:
             
         return jobs
 
-    def search_company_careers(self):
+    def search_company_careers(self, cancel_event=None):
         """Search target company career pages directly"""
         jobs = []
         companies = {
@@ -122,8 +185,13 @@ class JobLinkScraper:
         print(f"  🔍 Checking {len(companies)} target companies...")
         
         for company, url in companies.items():
+            if cancel_event is not None and cancel_event.is_set():
+                break
             try:
-                resp = requests.get(url, headers=self.headers, timeout=10)
+                resp = self.fetcher.fetch_sync(url)
+                if resp.status_code != 200:
+                    print(f"    ⚠️ {company}: status {resp.status_code}")
+                    continue
                 soup = BeautifulSoup(resp.content, 'html.parser')
                 
                 # Generic finder for keywords in links
@@ -144,53 +212,15 @@ class JobLinkScraper:
                             'source': 'CompanyDirect',
                             'scraped_at': datetime.now().isoformat()
                         })
-            except:
+            except Exception as e:
+                print(f"    ⚠️ {company}: {e}")
                 continue
                 
         return jobs
 
-    def search_ats_boards(self):
-        """Search Greenhouse/Lever API endpoints"""
-        jobs = []
-        # Greenhouse
-        gh_companies = ['airbnb', 'stripe', 'notion', 'figma']
-        for co in gh_companies:
-            try:
-                url = f"https://boards-api.greenhouse.io/v1/boards/{co}/jobs"
-                data = requests.get(url, timeout=5).json()
-                for j in data.get('jobs', []):
-                    if any(k in j['title'].lower() for k in ['ai', 'data', 'graduate', 'intern']):
-                        loc = j.get('location', {}).get('name', '').lower()
-                        if 'uk' in loc or 'london' in loc or 'remote' in loc:
-                            jobs.append({
-                                'title': j['title'],
-                                'company': co.title(),
-                                'url': j['absolute_url'],
-                                'source': 'Greenhouse',
-                                'scraped_at': datetime.now().isoformat()
-                            })
-            except: continue
-            
-        # Lever
-        lev_companies = ['spotify', 'netflix']
-        for co in lev_companies:
-            try:
-                url = f"https://api.lever.co/v0/postings/{co}"
-                data = requests.get(url, timeout=5).json()
-                for j in data:
-                    if any(k in j['text'].lower() for k in ['ai', 'data', 'graduate', 'intern']):
-                        loc = j.get('categories', {}).get('location', '').lower()
-                        if 'uk' in loc or 'london' in loc or 'remote' in loc:
-                            jobs.append({
-                                'title': j['text'],
-                                'company': co.title(),
-                                'url': j['hostedUrl'],
-                                'source': 'Lever',
-                                'scraped_at': datetime.now().isoformat()
-                            })
-            except: continue
-            
-        return jobs
+    def search_ats_boards(self, cancel_event=None):
+        """Search Greenhouse/Lever API endpoints (streamed, descriptions included inline)"""
+        return self.ats_ingestor.ingest(cancel_event=cancel_event)
 
     def search_graduate_schemes(self):
         """Search graduate scheme aggregators"""
@@ -216,12 +246,34 @@ class JobLinkScraper:
         except: pass
         return jobs
 
+    def close(self):
+        """Shut down the fetcher's worker threads (CVGenerator shares the fetcher, so close after generation)"""
+        self.fetcher.close()
+    
     def print_summary(self, jobs):
         from collections import Counter
         sources = Counter([j['source'] for j in jobs])
         print("\n📊 BREAKDOWN BY SOURCE:")
         for source, count in sources.most_common():
             print(f"   {source}: {count}")
+        
+        if self.source_report:
+            print("\n⏱️  SOURCE TIMINGS:")
+            for name, info in self.source_report.items():
+                print(f"   {name}: {info['status']} ({info['jobs']} jobs, {info['elapsed']:.1f}s)")
+        
+        rates = self.rate_controller.report()
+        if rates:
+            print("\n🚦 REQUEST RATES (adaptive):")
+            for host, info in rates.items():
+                print(f"   {host}: {info['rate']:.2f} req/s (ceiling {info['ceiling']:.2f}, throttled {info['throttled']}x, slowed {info['decreases']}x)")
+        
+        tripped = self.breakers.tripped()
+        if tripped:
+            print("\n🔌 CIRCUIT BREAKERS TRIPPED:")
+            for breaker in tripped:
+                status = f"open, {breaker.cooldown_remaining():.0f}s cool-down left" if breaker.state == 'open' else breaker.state
+                print(f"   {breaker.name}: {status} (tripped {breaker.trips}x, last error: {breaker.last_error})")
     
     def filter_jobs(self, jobs):
         """
@@ -229,92 +281,60 @@ class JobLinkScraper:
         - AI Intern
         - AI Trainee
         - AI Research Intern
+        Rules live in src/utils/title_classifier.py (shared with the LinkedIn inline filter).
         """
-        import re
         print("\n🧹 Filtering jobs (STRICT REGEX MODE: AI + Intern/Trainee)...")
         filtered = []
         
-        # 1. Target Phrases (Phrases that if found, automatically qualify the job)
-        valid_phrases = [
-            r'\bai intern\b', 
-            r'\bai trainee\b', 
-            r'\bai research intern\b',
-            r'\bartificial intelligence intern\b',
-            r'\bmachine learning intern\b',
-            r'\bml intern\b',
-            r'\bai placement\b',
-            r'\bartificial intelligence placement\b'
-        ]
-        
-        # 2. Component Logic (Title must have [AI term] AND [Intern term])
-        # Note: 'ai' must be a whole word to avoid matching 'trAIning', 'remAIl', etc.
-        ai_terms = [
-            r'\bai\b', 
-            r'\bartificial intelligence\b', 
-            r'\bmachine learning\b', 
-            r'\bml\b', 
-            r'\bdeep learning\b', 
-            r'\bcomputer vision\b', 
-            r'\bnlp\b', 
-            r'\bllm\b', 
-            r'\bgenerative ai\b'
-        ]
+        verdicts = classify_titles([job['title'] for job in jobs])
         
-        intern_terms = [
-            r'\bintern\b', 
-            r'\binternship\b', 
-            r'\btrainee\b', 
-            r'\bplacement\b', 
-            r'\bstudent\b',
-            r'\bundergraduate\b'
-        ]
-        
-        # Blacklist 
-        blacklist = ['senior', 'manager', 'lead', 'director', 'marketing', 'sales', 'hr', 'recruiter', 'agent', 'attorney', 'counsel']
-
-        for job in jobs:
-            title = job['title'].lower()
-            
-            # 1. exclusions
-            if any(bad in title for bad in blacklist):
-                 print(f"  🗑️  Dropped (Blacklist): {job['title']}")
-                 continue
-                 
-            # 2. Check strict criteria using Regex
-            is_valid = False
-            
-            # Check phrases
-            for pattern in valid_phrases:
-                if re.search(pattern, title):
-                    is_valid = True
-                    break
-            
-            # If phrase didn't match, check component combination
-            if not is_valid:
-                has_ai = any(re.search(pattern, title) for pattern in ai_terms)
-                has_intern = any(re.search(pattern, title) for pattern in intern_terms)
-                
-                if has_ai and has_intern:
-                    is_valid = True
-                
-            if is_valid:
+        for job, verdict in zip(jobs, verdicts):
+            if verdict.is_match:
                 filtered.append(job)
+            elif verdict.reason == REASON_BLACKLIST:
+                print(f"  🗑️  Dropped (Blacklist): {job['title']}")
             else:
                 # Debug print for "Trainee Patent Attorney" or "Internship Trainee"
+                title = job['title'].lower()
                 if "trainee" in title or "intern" in title:
                      print(f"  🗑️  Dropped (Strict Mismatched): {job['title']}")
-                else:
-                     pass # Don't spam console for obviously wrong ones
                 
         return filtered
     
+    def search_linkedin_roles(self, roles, hours_old=24, cancel_event=None):
+        """Run the LinkedIn search for several roles concurrently (results in role order)"""
+        async def run_all():
+            tasks = [asyncio.ensure_future(self.search_linkedin_advanced_async(role, hours_old)) for role in roles]
+            # Poll the cancel flag while the role searches run
+            while cancel_event is not None and not all(t.done() for t in tasks):
+                await asyncio.wait(tasks, timeout=0.5)
+                if cancel_event.is_set():
+                    for t in tasks:
+                        t.cancel()
+                    break
+            results = await asyncio.gather(*tasks, return_exceptions=True)
+            jobs = []
+            for role, result in zip(roles, results):
+                if isinstance(result, asyncio.CancelledError):
+                    print(f"  ⏹️  LinkedIn search for \"{role}\" cancelled")
+                elif isinstance(result, Exception):
+                    print(f"  ❌ LinkedIn search for \"{role}\" failed: {result}")
+                else:
+                    jobs.extend(result)
+            return jobs
+        
+        return asyncio.run(run_all())
+    
     def search_linkedin_advanced(self, role, hours_old=24):
         """
         Advanced LinkedIn search with multiple filters
         Parameters:
         - hours_old: 24, 168 (week), 720 (month)
         """
-        import re
+        return asyncio.run(self.search_linkedin_advanced_async(role, hours_old))
+    
+    async def search_linkedin_advanced_async(self, role, hours_old=24):
+        """Async LinkedIn search - all result pages for the role are fetched concurrently"""
         jobs = []
         
         # Time filters mapping
@@ -346,110 +366,190 @@ class JobLinkScraper:
         
         print(f"\nExample Query: \"{role}\" (Last {hours_old}h)")
         
-        # Scrape up to 4 pages (100 jobs) to keep it safe but effective
-        for page in range(0, 4):
-            params['start'] = page * 25
+        # Scrape up to 4 pages (100 jobs) to keep it safe but effective.
+        pages = [dict(params, start=page * 25) for page in range(0, 4)]
+        responses = None
+        if self.seen_index is None:
+            # Pages are requested together; the host's token bucket paces them.
+            responses = await self.fetcher.fetch_all(
+                [(base_url, page_params) for page_params in pages],
+                cache_source='linkedin_search'
+            )
+        # Otherwise (incremental mode) results are newest-first, so we stop at the
+        # first page with nothing new on it; the next page is already in flight while
+        # one is parsed, so at most one request per role is spent past the stop.
+        
+        def fetch_page(page):
+            if page >= len(pages):
+                return None
+            return asyncio.ensure_future(self.fetcher.fetch(base_url, pages[page], cache_source='linkedin_search'))
+        
+        in_flight = fetch_page(0) if responses is None else None
+        for page, page_params in enumerate(pages):
+            if responses is not None:
+                response = responses[page]
+            else:
+                try:
+                    response = await in_flight
+                except Exception as e:
+                    response = e
+                in_flight = fetch_page(page + 1)
+                # Let it start (into the fetch thread pool) before this page is parsed
+                await asyncio.sleep(0)
             
-            try:
-                response = requests.get(base_url, params=params, headers=self.headers, timeout=10)
-                
-                if response.status_code != 200:
-                    print(f"  ⚠️ Status {response.status_code} on page {page}")
-                    break
-                
-                soup = BeautifulSoup(response.content, 'html.parser')
-                job_cards = soup.find_all('li')
-                
-                if not job_cards:
-                    # If no jobs found on this page, stop
-                    break
-                
-                for card in job_cards:
-                    try:
-                        base_card = card.find('div', class_='base-card')
-                        if not base_card:
-                            continue
-                        
-                        title_elem = base_card.find('h3', class_='base-search-card__title')
-                        company_elem = base_card.find('h4', class_='base-search-card__subtitle')
-                        location_elem = base_card.find('span', class_='job-search-card__location')
-                        link_elem = base_card.find('a', class_='base-card__full-link')
-                        date_elem = base_card.find('time', class_='job-search-card__listdate')
-                        
-                        if title_elem and company_elem and link_elem:
-                            job_url = link_elem.get('href', '')
-                            clean_url = job_url.split('?')[0] if '?' in job_url else job_url
-                            
-                            # --- INLINE FILTERING ---
-                            # Only accept if title STRICTLY matches requirements
-                            title_text = title_elem.text.strip()
-                            title_lower = title_text.lower()
-                            
-                            # 1. Regex Validation
-                            valid_phrases = [
-                                r'\bai intern\b', r'\bai trainee\b', r'\bai research intern\b',
-                                r'\bartificial intelligence intern\b', r'\bmachine learning intern\b', 
-                                r'\bml intern\b'
-                            ]
-                            
-                            is_valid = False
-                            for pattern in valid_phrases:
-                                if re.search(pattern, title_lower):
-                                    is_valid = True
-                                    break
-                            
-                            # If not exact phrase, check very strict component match
-                            # Must have (AI words) AND (Intern words)
-                            if not is_valid:
-                                ai_terms = [r'\bai\b', r'\bartificial intelligence\b', r'\bml\b']
-                                intern_terms = [r'\bintern\b', r'\binternship\b', r'\btrainee\b']
-                                
-                                has_ai = any(re.search(p, title_lower) for p in ai_terms)
-                                has_intern = any(re.search(p, title_lower) for p in intern_terms)
-                                if has_ai and has_intern:
-                                    is_valid = True
-                            
-                            if not is_valid:
-                                # Silently skip irrelevant ones to avoid user confusion
-                                continue
-                                
-                            job = {
-                                'title': title_text,
-                                'company': company_elem.text.strip(),
-                                'location': location_elem.text.strip() if location_elem else 'Remote/UK',
-                                'url': clean_url,
-                                'date_posted': date_elem.get('datetime') if date_elem else f'Last {hours_old}h',
-                                'source': 'LinkedIn',
-                                'search_role': role,
-                                'scraped_at': datetime.now().isoformat()
-                            }
-                            
-                            jobs.append(job)
-                            print(f"  ✓ {job['title']} at {job['company']}")
-                    
-                    except Exception as e:
-                        continue
-                
-                # Polite rate limiting between pages
-                time.sleep(1.5)
+            if isinstance(response, Exception):
+                print(f"  ❌ Page {page} error: {response}")
+                break
             
-            except Exception as e:
-                print(f"  ❌ Page {page} error: {e}")
+            if response.status_code != 200:
+                print(f"  ⚠️ Status {response.status_code} on page {page}")
+                break
+            
+            # Only the base-card nodes are parsed (lxml fast path, BeautifulSoup fallback)
+            job_cards = parse_job_cards(response.content, backend=self.parser_backend)
+            if not job_cards:
+                # If no jobs found on this page, stop
+                break
+            
+            jobs.extend(self._jobs_from_cards(job_cards, role, hours_old))
+            
+            if self.seen_index is not None and self._all_cards_known(job_cards):
+                print(f"  ⏹️  Page {page} only has postings seen in earlier runs, stopping")
                 break
         
+        if in_flight is not None:
+            in_flight.cancel()
         print(f"  ✅ Found {len(jobs)} jobs for \"{role}\"")
         return jobs
+    
+    def _jobs_from_cards(self, job_cards, role, hours_old):
+        """Turn parsed JobCard tuples into job dicts, keeping only STRICT title matches"""
+        jobs = []
+        
+        for card in job_cards:
+            # --- INLINE FILTERING ---
+            # Only accept if title STRICTLY matches requirements
+            if not classify_title(card.title).is_match:
+                # Silently skip irrelevant ones to avoid user confusion
+                continue
+            
+            job = {
+                'title': card.title,
+                'company': card.company,
+                'location': card.location if card.location is not None else 'Remote/UK',
+                'url': card.url,
+                'date_posted': card.date_posted if card.date_posted else f'Last {hours_old}h',
+                'source': 'LinkedIn',
+                'search_role': role,
+                'scraped_at': datetime.now().isoformat()
+            }
+            
+            jobs.append(job)
+            print(f"  ✓ {job['title']} at {job['company']}")
+        
+        return jobs
+    
+    def _all_cards_known(self, job_cards):
+        """
+        Queue every card on the page (relevant or not) for the seen index and
+        report whether all of them were already known from earlier runs.
+        """
+        ids = []
+        for card in job_cards:
+            job_id = canonical_job_id(card.url)
+            ids.append(job_id)
+            self._pending_seen.append({
+                'job_id': job_id,
+                'title': card.title,
+                'company': card.company,
+                'url': card.url,
+                'source': 'LinkedIn'
+            })
+        return len(self.seen_index.known_ids(ids)) == len(set(ids))
+    
+    @staticmethod
+    def _index_entry(job):
+        return {
+            'job_id': canonical_job_id(job['url']),
+            'title': job['title'],
+            'company': job['company'],
+            'url': job['url'],
+            'source': job['source']
+        }
+    
+    def _update_seen_index(self, jobs):
+        """
+        Work out which jobs still need a CV (never tailored in an earlier run),
+        then record everything seen this run for the pagination early-stop
+        """
+        ids = {canonical_job_id(job['url']) for job in jobs}
+        self.new_job_ids = ids - self.seen_index.tailored_ids(ids)
+        
+        self.seen_index.mark_seen(self._pending_seen + [self._index_entry(job) for job in jobs])
+        self._pending_seen = []
+        
+        print(f"\n🆕 {len(self.new_job_ids)} jobs not tailored yet, {len(ids) - len(self.new_job_ids)} already tailored in earlier runs")
+    
+    def filter_new_jobs(self, jobs):
+        """Keep only jobs with no tailored CV from an earlier run (all jobs when no seen index is used)"""
+        if self.seen_index is None:
+            return jobs
+        return [job for job in jobs if canonical_job_id(job['url']) in self.new_job_ids]
+    
+    def mark_tailored(self, jobs):
+        """Record jobs whose tailored CV was saved, so --new-only skips them from now on"""
+        if self.seen_index is not None and jobs:
+            self.seen_index.mark_tailored([self._index_entry(job) for job in jobs])
 
     def remove_duplicates(self, jobs):
-        """Remove duplicate jobs based on title + company"""
+        """
+        Remove duplicate jobs, first seen wins:
+        1. same canonical job ID (LinkedIn / Greenhouse / Lever ID, whatever the tracking URL)
+        2. same title + company
+        3. near-duplicates (reposts with lightly edited titles, same posting on several sources)
+        Two jobs that both have a description are compared on title + description
+        shingles; when either side has none (e.g. a LinkedIn card vs. the ATS posting
+        with its inline JD) only their titles are compared, since hundreds of
+        description shingles on one side would otherwise swamp the title overlap.
+        """
+        seen_ids = set()
         seen = set()
+        detector = NearDuplicateDetector(threshold=self.near_duplicate_threshold)
+        # Title-only signatures, grouped by (company, has a description)
+        title_detector = NearDuplicateDetector(threshold=self.near_duplicate_threshold)
         unique = []
         
         for job in jobs:
+            job_id = canonical_job_id(job.get('url'))
+            if job_id and job_id in seen_ids:
+                continue
+            
             key = f"{job['title'].lower()}|{job['company'].lower()}"
-            if key not in seen:
-                seen.add(key)
-                unique.append(job)
+            if key in seen:
+                continue
+            
+            company = company_key(job['company'])
+            has_description = bool(job.get('description'))
+            signature = detector.signature(job_shingles(job)) if has_description else None
+            title_signature = title_detector.signature(job_shingles({'title': job['title']}))
+            matches = [
+                detector.query(signature, group=company),
+                title_detector.query(title_signature, group=(company, False)),
+            ]
+            if not has_description:
+                matches.append(title_detector.query(title_signature, group=(company, True)))
+            match = max((m for m in matches if m), key=lambda m: m[1], default=None)
+            if match:
+                original = unique[match[0]]
+                print(f"  ♻️  Near-duplicate ({match[1]:.0%}): {job['title']} at {job['company']} ~ {original['title']} at {original['company']}")
+                continue
+            
+            if job_id:
+                seen_ids.add(job_id)
+            seen.add(key)
+            detector.add(len(unique), signature, group=company)
+            title_detector.add(len(unique), title_signature, group=(company, has_description))
+            unique.append(job)
         
         return unique
     
@@ -0,0 +1,170 @@
+# src/utils/async_fetcher.py
+
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from urllib.parse import urlparse
+
+from src.utils.http_client import get_client
+from src.utils.rate_control import CircuitOpenError, THROTTLE_STATUSES
+
+
+class TokenBucket:
+    """
+    Token bucket refilled at `rate` tokens/sec, holding at most `capacity`.
+    Callers reserve a token up front and sleep off any deficit, so the bucket
+    works from any thread or event loop.
+    """
+
+    def __init__(self, rate, capacity):
+        self.rate = float(rate)
+        self.capacity = float(capacity)
+        self.tokens = float(capacity)
+        self.updated = time.monotonic()
+        self.paused_until = 0.0
+        self._lock = threading.Lock()
+
+    def reserve(self):
+        """Take one token and return how long the caller must wait before using it"""
+        with self._lock:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            self.tokens -= 1
+            delay = 0.0 if self.tokens >= 0 else -self.tokens / self.rate
+            return max(delay, self.paused_until - now)
+
+    def pause(self, seconds):
+        """Hold every caller back for `seconds` (e.g. a Retry-After) and drop the saved burst"""
+        with self._lock:
+            self.paused_until = max(self.paused_until, time.monotonic() + seconds)
+            self.tokens = min(self.tokens, 0.0)
+
+    async def acquire(self):
+        delay = self.reserve()
+        if delay:
+            await asyncio.sleep(delay)
+
+    def wait(self):
+        """Blocking variant of acquire() for plain threads"""
+        delay = self.reserve()
+        if delay:
+            time.sleep(delay)
+
+
+class HostRateLimiter:
+    """One token bucket per host, with optional per-host (rate, burst) overrides"""
+
+    def __init__(self, default_rate=2.0, default_burst=4, host_limits=None):
+        self.default_rate = default_rate
+        self.default_burst = default_burst
+        self.host_limits = dict(host_limits or {})
+        self.buckets = {}
+        self._lock = threading.Lock()
+
+    def bucket_for(self, host):
+        with self._lock:
+            bucket = self.buckets.get(host)
+            if bucket is None:
+                rate, burst = self.host_limits.get(host, (self.default_rate, self.default_burst))
+                bucket = TokenBucket(rate, burst)
+                self.buckets[host] = bucket
+            return bucket
+
+    async def acquire(self, url):
+        await self.bucket_for(urlparse(url).netloc).acquire()
+
+    def wait(self, url):
+        self.bucket_for(urlparse(url).netloc).wait()
+
+
+class AsyncFetcher:
+    """
+    Runs blocking HTTP GETs on a thread pool behind an asyncio interface.
+    Every request first takes a token from its host's bucket, so concurrency
+    is bounded by `max_concurrency` and throughput by the per-host rates.
+    With a rate controller and circuit breakers attached, each response also
+    tunes its host's rate (AIMD), throttled requests are retried after the
+    back-off, and failing hosts are skipped until their cool-down ends.
+    """
+
+    def __init__(self, rate_limiter=None, client=None, max_concurrency=8, timeout=None,
+                 rate_controller=None, breakers=None, throttle_retries=2):
+        self.rate_limiter = rate_limiter or HostRateLimiter()
+        self.client = client or get_client()
+        self.max_concurrency = max_concurrency
+        self.timeout = timeout
+        self.rate_controller = rate_controller
+        self.breakers = breakers
+        self.throttle_retries = throttle_retries
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix='fetch')
+
+    async def fetch(self, url, params=None, cache_source=None):
+        # Fresh cache hits never touch the network, so they don't spend a token
+        cached = self.client.get_fresh_cached(url, params, cache_source)
+        if cached is not None:
+            return cached
+        loop = asyncio.get_running_loop()
+        call = partial(self._get_and_record, url, params, cache_source)
+        for attempt in range(self.throttle_retries + 1):
+            self._check_breaker(url)
+            await self.rate_limiter.acquire(url)
+            response = await loop.run_in_executor(self._executor, call)
+            if response.status_code not in THROTTLE_STATUSES or attempt == self.throttle_retries:
+                return response
+            # The controller has already slowed/paused the host; try again behind it
+        return response
+
+    def fetch_sync(self, url, params=None, cache_source=None):
+        """Blocking variant of fetch() for sources that run in plain threads"""
+        cached = self.client.get_fresh_cached(url, params, cache_source)
+        if cached is not None:
+            return cached
+        for attempt in range(self.throttle_retries + 1):
+            self._check_breaker(url)
+            self.rate_limiter.wait(url)
+            response = self._get_and_record(url, params, cache_source)
+            if response.status_code not in THROTTLE_STATUSES or attempt == self.throttle_retries:
+                return response
+        return response
+
+    def _check_breaker(self, url):
+        if self.breakers is not None:
+            breaker = self.breakers.for_url(url)
+            if not breaker.allow():
+                raise CircuitOpenError(f"{breaker.name} paused for another {breaker.cooldown_remaining():.0f}s")
+
+    def _get_and_record(self, url, params, cache_source):
+        started = time.monotonic()
+        try:
+            response = self.client.get(url, params=params, timeout=self.timeout, cache_source=cache_source)
+        except Exception as e:
+            if self.rate_controller is not None:
+                self.rate_controller.on_error(url)
+            if self.breakers is not None:
+                self.breakers.for_url(url).record_failure(type(e).__name__)
+            raise
+        latency = time.monotonic() - started
+
+        if self.rate_controller is not None:
+            self.rate_controller.on_response(url, response.status_code, latency, response.headers.get('Retry-After'))
+        if self.breakers is not None:
+            breaker = self.breakers.for_url(url)
+            if response.status_code in THROTTLE_STATUSES or response.status_code >= 500:
+                breaker.record_failure(f"HTTP {response.status_code}")
+            else:
+                breaker.record_success()
+        return response
+
+    async def fetch_all(self, requests_to_make, cache_source=None):
+        """
+        Fetch (url, params) pairs concurrently.
+        Returns responses in input order; failed requests come back as the exception.
+        """
+        tasks = [self.fetch(url, params, cache_source) for url, params in requests_to_make]
+        return await asyncio.gather(*tasks, return_exceptions=True)
+
+    def close(self):
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,113 @@
+# src/utils/context_cache.py
+
+import abc
+import datetime
+import hashlib
+import threading
+
+import google.generativeai as genai
+
+
+class _PrefixedModel:
+    """Model wrapper that sends `prefix + suffix` (what a cached context amounts to)"""
+
+    def __init__(self, model, prefix):
+        self.model = model
+        self.prefix = prefix
+
+    def generate_content(self, contents, **kwargs):
+        return self.model.generate_content(self.prefix + contents, **kwargs)
+
+
+class ContextCache(abc.ABC):
+    """
+    Uploads a static prompt prefix once and hands out a model bound to it,
+    so each request only sends its per-job suffix.
+    model_for() returns None when the prefix can't be cached; callers then
+    fall back to sending prefix + suffix inline.
+    Subclasses implement _create(model_name, prefix).
+    """
+
+    def __init__(self):
+        self.stats = {'uploads': 0, 'requests': 0, 'failures': 0}
+        self._lock = threading.Lock()
+        self._key = None
+        self._model = None
+
+    def model_for(self, model_name, prefix):
+        key = hashlib.sha256(f"{model_name}\0{prefix}".encode('utf-8')).hexdigest()
+        with self._lock:
+            if key != self._key:
+                self._key = key
+                self._model = None
+                try:
+                    self._model = self._create(model_name, prefix)
+                    self.stats['uploads'] += 1
+                except Exception as e:
+                    self.stats['failures'] += 1
+                    print(f"  ⚠️ Context cache unavailable, sending the prompt inline: {e}")
+            if self._model is not None:
+                self.stats['requests'] += 1
+            return self._model
+
+    @abc.abstractmethod
+    def _create(self, model_name, prefix):
+        """Upload/bind the prefix and return a model whose requests carry only the suffix"""
+
+    def close(self):
+        pass
+
+
+class LocalContextCache(ContextCache):
+    """
+    Stand-in for tests and offline runs: keeps the prefix locally and prepends
+    it to every request, with the same interface and stats as the real cache.
+    """
+
+    def __init__(self, model_factory=None):
+        super().__init__()
+        self.model_factory = model_factory or genai.GenerativeModel
+
+    def _create(self, model_name, prefix):
+        return _PrefixedModel(self.model_factory(model_name), prefix)
+
+
+class GeminiContextCache(ContextCache):
+    """
+    Gemini explicit context caching: the prefix is uploaded once as
+    CachedContent (billed at the cached-token rate while its TTL lasts) and
+    requests go through GenerativeModel.from_cached_content().
+    The API has a minimum cacheable size, so short prefixes fall back to inline.
+    """
+
+    def __init__(self, ttl_minutes=60, display_name='jarvis-cv-prefix'):
+        super().__init__()
+        self.ttl = datetime.timedelta(minutes=ttl_minutes)
+        self.display_name = display_name
+        self._cached_content = None
+
+    def _create(self, model_name, prefix):
+        self._delete()
+        self._cached_content = genai.caching.CachedContent.create(
+            model=model_name if model_name.startswith('models/') else f"models/{model_name}",
+            display_name=self.display_name,
+            contents=[prefix],
+            ttl=self.ttl,
+        )
+        print(f"  📌 Uploaded static prompt prefix to the context cache (TTL {self.ttl})")
+        return genai.GenerativeModel.from_cached_content(cached_content=self._cached_content)
+
+    def _delete(self):
+        if self._cached_content is not None:
+            try:
+                self._cached_content.delete()
+            except Exception:
+                pass
+            self._cached_content = None
+
+    def close(self):
+        """Drop the cached prefix now instead of paying for it until the TTL runs out"""
+        with self._lock:
+            self._delete()
+            self._key = None
+            self._model = None
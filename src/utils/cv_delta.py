@@ -0,0 +1,97 @@
+# src/utils/cv_delta.py
+
+import copy
+
+# List fields an experience entry may keep its bullets under
+_BULLET_FIELDS = ('achievements', 'bullets', 'responsibilities', 'highlights')
+
+
+def with_project_ids(project_pool):
+    """Pool entries with a stable 'id' (their own, or 'p<index>') so the model can refer to them"""
+    return [
+        dict(project, id=str(project.get('id') or f"p{i}")) if isinstance(project, dict) else project
+        for i, project in enumerate(project_pool)
+    ]
+
+
+def _reorder_skills(skills, order):
+    """Reorder each category by `order`, keeping only skills the CV really has (unknown ones are dropped)"""
+    if not isinstance(skills, dict):
+        return skills
+    order = order if isinstance(order, dict) else {}
+    categories = [c for c in order if c in skills] + [c for c in skills if c not in order]
+    result = {}
+    for category in categories:
+        original = list(skills[category]) if isinstance(skills[category], list) else skills[category]
+        if not isinstance(original, list):
+            result[category] = original
+            continue
+        by_key = {str(s).lower(): s for s in original}
+        ordered = []
+        for skill in order.get(category) or []:
+            key = str(skill).lower()
+            if key in by_key and by_key[key] not in ordered:
+                ordered.append(by_key[key])
+        result[category] = ordered + [s for s in original if s not in ordered]
+    return result
+
+
+def _project(entry, rewrite):
+    bullets = rewrite.get('achievements') or entry.get('achievements') or entry.get('key_contributions') or []
+    project = {
+        'title': entry.get('title') or entry.get('name', ''),
+        'date': entry.get('date', ''),
+        'technologies': list(entry.get('technologies', [])),
+        'description': rewrite.get('description') or entry.get('description', ''),
+        'achievements': list(bullets),
+    }
+    for key in ('context', 'company_or_context', 'link'):
+        if entry.get(key):
+            project[key] = entry[key]
+    return project
+
+
+def merge_delta(base_cv, projects_by_id, delta, fallback_projects=()):
+    """
+    Apply a delta answer onto the generic CV and return a full tailored_cv in
+    the shape PDFGenerator consumes: unchanged sections (personal_info,
+    education, certifications) are copied, the summary and bullets replaced,
+    skills reordered and the selected pool projects rewritten.
+    Returns (tailored_cv, warnings).
+    """
+    base = copy.deepcopy(base_cv) if isinstance(base_cv, dict) else {}
+    warnings = []
+
+    tailored = {
+        'personal_info': base.get('personal_info', {}),
+        'professional_summary': delta.get('professional_summary') or base.get('professional_summary', ''),
+        'skills': _reorder_skills(base.get('skills', {}), delta.get('skills_order')),
+        'experience': base.get('experience', []),
+        'projects': [],
+        'education': base.get('education', {}),
+        'certifications': base.get('certifications', []),
+    }
+
+    for key, bullets in (delta.get('experience_bullets') or {}).items():
+        try:
+            entry = tailored['experience'][int(key)]
+        except (ValueError, IndexError, TypeError):
+            warnings.append(f"unknown experience index {key}")
+            continue
+        if isinstance(entry, dict) and isinstance(bullets, list):
+            field = next((f for f in _BULLET_FIELDS if isinstance(entry.get(f), list)), 'achievements')
+            entry[field] = bullets
+
+    for rewrite in delta.get('projects') or []:
+        entry = projects_by_id.get(str(rewrite.get('id'))) if isinstance(rewrite, dict) else None
+        if entry is None:
+            warnings.append(f"unknown project id {rewrite.get('id') if isinstance(rewrite, dict) else rewrite}")
+            continue
+        tailored['projects'].append(_project(entry, rewrite))
+
+    if not tailored['projects']:
+        # Nothing usable selected: fall back to the locally top-ranked candidates, unedited
+        tailored['projects'] = [_project(entry, {}) for entry in list(fallback_projects)[:2]]
+        warnings.append("no valid project selected; used the top-ranked candidates")
+
+    return tailored, warnings
@@ -0,0 +1,158 @@
+# src/utils/cv_schema.py
+
+import re
+
+# --- Field types -----------------------------------------------------------
+# Each type checks (and lightly coerces) a value and returns (value, problems),
+# where problems are dotted paths like 'tailored_cv.projects'.
+
+
+class Str:
+    def __init__(self, required=True):
+        self.required = required
+
+    def check(self, value, path):
+        if isinstance(value, str) and value.strip():
+            return value, []
+        return value, [path]
+
+
+class Score:
+    """0-100 number; '85', '85%' and 85.0 are all accepted as 85"""
+
+    required = True
+
+    def check(self, value, path):
+        if isinstance(value, str):
+            match = re.match(r'\s*(\d+(?:\.\d+)?)\s*%?\s*$', value)
+            value = float(match.group(1)) if match else value
+        if isinstance(value, (int, float)) and not isinstance(value, bool) and 0 <= value <= 100:
+            return int(value) if float(value).is_integer() else value, []
+        return value, [path]
+
+
+class List:
+    def __init__(self, item=None, required=True, min_items=0):
+        self.item = item
+        self.required = required
+        self.min_items = min_items
+
+    def check(self, value, path):
+        if isinstance(value, str) and self.item is None:
+            value = [v.strip() for v in value.split(',') if v.strip()]
+        if not isinstance(value, list) or len(value) < self.min_items:
+            return value, [path]
+        if self.item is None:
+            return value, []
+        problems = []
+        checked = []
+        for n, entry in enumerate(value):
+            entry, entry_problems = self.item.check(entry, f"{path}[{n}]")
+            checked.append(entry)
+            problems += entry_problems
+        return checked, problems
+
+
+class Obj:
+    def __init__(self, fields=None, required=True, values=None):
+        self.fields = fields or {}
+        self.required = required
+        self.values = values   # type of every value, for free-form maps like skills
+
+    def check(self, value, path):
+        if not isinstance(value, dict):
+            return value, [path]
+        value = dict(value)
+        problems = []
+        for name, field in self.fields.items():
+            field_path = f"{path}.{name}" if path else name
+            if name not in value or value[name] is None:
+                if field.required:
+                    problems.append(field_path)
+                continue
+            value[name], field_problems = field.check(value[name], field_path)
+            problems += field_problems
+        if self.values is not None:
+            for name in list(value):
+                if name not in self.fields:
+                    value[name], field_problems = self.values.check(value[name], f"{path}.{name}")
+                    problems += field_problems
+        return value, problems
+
+
+# --- The tailoring result --------------------------------------------------
+
+PROJECT = Obj({
+    'title': Str(),
+    'technologies': List(required=False),
+    'description': Str(required=False),
+    'achievements': List(Str(), min_items=1),
+})
+
+JOB_ANALYSIS = Obj({
+    'match_score': Score(),
+    'key_requirements': List(required=False),
+    'selected_projects_reasoning': Str(required=False),
+})
+
+# What the analysis tier returns
+ANALYSIS_RESULT = Obj({'job_analysis': JOB_ANALYSIS})
+
+TAILORED_CV_RESULT = Obj({
+    'job_analysis': JOB_ANALYSIS,
+    'tailored_cv': Obj({
+        'personal_info': Obj(required=False),
+        'professional_summary': Str(),
+        'skills': Obj(values=List()),
+        'experience': List(required=False),
+        'projects': List(PROJECT, min_items=1),
+        'education': Obj(required=False),
+        'certifications': List(required=False),
+    }),
+})
+
+# Delta output mode: only the sections that change, merged onto the generic CV locally
+DELTA_RESULT = Obj({
+    'job_analysis': JOB_ANALYSIS,
+    'delta': Obj({
+        'professional_summary': Str(),
+        'skills_order': Obj(required=False, values=List()),
+        'projects': List(Obj({
+            'id': Str(),
+            'description': Str(required=False),
+            'achievements': List(Str(), min_items=1),
+        }), min_items=1),
+        'experience_bullets': Obj(required=False, values=List(Str())),
+    }),
+})
+
+# Re-asks regenerate whole sections: a problem anywhere under one maps to it
+SECTION_DEPTH = {'job_analysis': 1, 'tailored_cv': 2, 'delta': 2}
+
+
+def section_of(problem):
+    parts = re.split(r'[.\[]', problem)
+    return '.'.join(parts[:SECTION_DEPTH.get(parts[0], 1)])
+
+
+def validate_result(data, schema=TAILORED_CV_RESULT):
+    """(coerced data, sorted list of invalid/missing sections); no sections means valid"""
+    data, problems = schema.check(data, '')
+    return data, sorted({section_of(p) for p in problems})
+
+
+def get_section(data, section):
+    for part in section.split('.'):
+        if not isinstance(data, dict) or part not in data:
+            return None
+        data = data[part]
+    return data
+
+
+def set_section(data, section, value):
+    parts = section.split('.')
+    for part in parts[:-1]:
+        if not isinstance(data.get(part), dict):
+            data[part] = {}
+        data = data[part]
+    data[parts[-1]] = value
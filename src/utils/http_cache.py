@@ -0,0 +1,170 @@
+# src/utils/http_cache.py
+
+import json
+import time
+import zlib
+
+import requests
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from src.utils.sqlite_store import SQLiteStore
+
+# Seconds a stored page is served without touching the network, per source.
+# Past its TTL an entry is revalidated with If-None-Match / If-Modified-Since.
+DEFAULT_TTLS = {
+    'linkedin_search': 15 * 60,      # listings move quickly (newest-first, last 24h)
+    'job_description': 24 * 3600,    # a posting's JD rarely changes
+}
+
+# Only these headers are kept with the body; content-encoding/length are
+# dropped because the stored body is already decoded.
+_KEPT_HEADERS = ('content-type', 'etag', 'last-modified', 'date', 'cache-control')
+
+
+class HTTPCache(SQLiteStore):
+    """
+    On-disk HTTP cache (SQLite) for listing and JD pages.
+    - per-source TTLs, then conditional revalidation via ETag / Last-Modified
+    - bodies stored zlib-compressed, total size bounded with LRU eviction
+    - stats: hits, revalidations, misses, bytes saved
+    """
+
+    SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS responses (
+            key TEXT PRIMARY KEY,
+            source TEXT,
+            status INTEGER,
+            headers TEXT,
+            body BLOB,
+            body_size INTEGER,
+            stored_size INTEGER,
+            etag TEXT,
+            last_modified TEXT,
+            stored_at REAL,
+            last_access REAL
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_responses_access ON responses(last_access)",
+    )
+
+    def __init__(self, path='data/cache/http_cache.sqlite', ttls=None, max_bytes=200 * 1024 * 1024,
+                 default_ttl=0):
+        super().__init__(path)
+        self.ttls = dict(DEFAULT_TTLS, **(ttls or {}))
+        self.default_ttl = default_ttl
+        self.max_bytes = max_bytes
+        self.stats = {
+            'hits': 0,
+            'revalidations': 0,
+            'misses': 0,
+            'stores': 0,
+            'evictions': 0,
+            'bytes_saved': 0,
+        }
+
+    def ttl_for(self, source):
+        return self.ttls.get(source, self.default_ttl)
+
+    def lookup(self, key):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT status, headers, body, body_size, etag, last_modified, stored_at FROM responses WHERE key = ?",
+                (key,)
+            ).fetchone()
+        if not row:
+            return None
+        status, headers, body, body_size, etag, last_modified, stored_at = row
+        return {
+            'key': key,
+            'status': status,
+            'headers': json.loads(headers),
+            'body': body,
+            'body_size': body_size,
+            'etag': etag,
+            'last_modified': last_modified,
+            'stored_at': stored_at,
+        }
+
+    def is_fresh(self, entry, source):
+        return time.time() - entry['stored_at'] < self.ttl_for(source)
+
+    def conditional_headers(self, entry):
+        headers = {}
+        if entry.get('etag'):
+            headers['If-None-Match'] = entry['etag']
+        if entry.get('last_modified'):
+            headers['If-Modified-Since'] = entry['last_modified']
+        return headers
+
+    def record_hit(self, entry):
+        with self._lock:
+            self.stats['hits'] += 1
+            self.stats['bytes_saved'] += entry['body_size']
+            self._conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (time.time(), entry['key']))
+            self._conn.commit()
+
+    def record_revalidation(self, entry, response_headers):
+        """A 304 came back: the stored body is still good, restart its TTL"""
+        now = time.time()
+        etag = response_headers.get('ETag') or entry['etag']
+        last_modified = response_headers.get('Last-Modified') or entry['last_modified']
+        with self._lock:
+            self.stats['revalidations'] += 1
+            self.stats['bytes_saved'] += entry['body_size']
+            self._conn.execute(
+                "UPDATE responses SET stored_at = ?, last_access = ?, etag = ?, last_modified = ? WHERE key = ?",
+                (now, now, etag, last_modified, entry['key'])
+            )
+            self._conn.commit()
+
+    def record_miss(self):
+        with self._lock:
+            self.stats['misses'] += 1
+
+    def store(self, key, source, response):
+        cache_control = response.headers.get('Cache-Control', '').lower()
+        if 'no-store' in cache_control:
+            return
+
+        content = response.content
+        body = zlib.compress(content)
+        headers = {k: v for k, v in response.headers.items() if k.lower() in _KEPT_HEADERS}
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, source, response.status_code, json.dumps(headers), body, len(content), len(body),
+                 response.headers.get('ETag'), response.headers.get('Last-Modified'), now, now)
+            )
+            self.stats['stores'] += 1
+            self._evict()
+            self._conn.commit()
+
+    def _evict(self):
+        """Drop least-recently-used entries until the stored size fits max_bytes (lock held)"""
+        self.stats['evictions'] += self._evict_lru('responses', self.max_bytes)
+
+    def to_response(self, entry, url):
+        """Rebuild a requests.Response from a stored entry so callers can't tell the difference"""
+        response = requests.Response()
+        response.status_code = entry['status']
+        response._content = zlib.decompress(entry['body'])
+        response.headers = CaseInsensitiveDict(entry['headers'])
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = url
+        response.from_cache = True
+        return response
+
+    def report(self):
+        stats = dict(self.stats)
+        lookups = stats['hits'] + stats['revalidations'] + stats['misses']
+        stats['hit_rate'] = (stats['hits'] + stats['revalidations']) / lookups if lookups else 0.0
+        return stats
+
+    def print_stats(self):
+        stats = self.report()
+        print("\n🗄️  HTTP CACHE:")
+        print(f"   Hits: {stats['hits']}  Revalidated (304): {stats['revalidations']}  Misses: {stats['misses']}")
+        print(f"   Hit rate: {stats['hit_rate']:.0%}  Bytes saved: {stats['bytes_saved'] / 1024:.1f} KB  Evictions: {stats['evictions']}")
@@ -0,0 +1,128 @@
+# src/utils/http_client.py
+
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from src.utils.http_cache import HTTPCache
+
+# urllib3 decodes brotli transparently when a brotli package is importable,
+# so only advertise it when we can actually decode it.
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        ACCEPT_ENCODING = 'gzip, deflate, br'
+    except ImportError:
+        ACCEPT_ENCODING = 'gzip, deflate'
+
+DEFAULT_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept-Encoding': ACCEPT_ENCODING,
+}
+
+
+class HTTPClient:
+    """
+    Shared HTTP layer for the scraper and the JD fetcher.
+    - Keep-alive connection pools per host (one TCP+TLS handshake per connection, not per request)
+    - Transparent gzip/brotli decoding
+    - One retry policy for transient failures (connection errors, 5xx)
+    - Optional on-disk conditional-GET cache, used for requests that pass a cache_source
+    """
+
+    def __init__(self, pool_connections=10, pool_maxsize=20, retries=3, backoff_factor=0.5,
+                 timeout=10, headers=None, cache=None):
+        self.timeout = timeout
+        self.cache = cache
+        self.headers = dict(DEFAULT_HEADERS, **(headers or {}))
+
+        retry = Retry(
+            total=retries,
+            connect=retries,
+            read=retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=(500, 502, 503, 504),
+            allowed_methods=frozenset(['GET', 'HEAD']),
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        # pool_connections = number of hosts kept warm, pool_maxsize = sockets per host
+        adapter = HTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize, max_retries=retry)
+
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+    def get(self, url, params=None, headers=None, timeout=None, cache_source=None, **kwargs):
+        """
+        GET through the pooled session.
+        With a cache_source (e.g. 'linkedin_search', 'job_description') the on-disk
+        cache is consulted first and stale entries are revalidated conditionally.
+        """
+        if self.cache is None or cache_source is None:
+            return self._get(url, params, headers, timeout, **kwargs)
+
+        key = self.cache_key(url, params)
+        entry = self.cache.lookup(key)
+        if entry and self.cache.is_fresh(entry, cache_source):
+            self.cache.record_hit(entry)
+            return self.cache.to_response(entry, url)
+
+        request_headers = dict(headers or {})
+        if entry:
+            request_headers.update(self.cache.conditional_headers(entry))
+
+        response = self._get(url, params, request_headers, timeout, **kwargs)
+
+        if response.status_code == 304 and entry:
+            self.cache.record_revalidation(entry, response.headers)
+            return self.cache.to_response(entry, url)
+
+        self.cache.record_miss()
+        if response.status_code == 200:
+            self.cache.store(key, cache_source, response)
+        return response
+
+    def get_fresh_cached(self, url, params=None, cache_source=None):
+        """Return a cached response that is still within its TTL, without any network I/O"""
+        if self.cache is None or cache_source is None:
+            return None
+        entry = self.cache.lookup(self.cache_key(url, params))
+        if entry and self.cache.is_fresh(entry, cache_source):
+            self.cache.record_hit(entry)
+            return self.cache.to_response(entry, url)
+        return None
+
+    def cache_key(self, url, params=None):
+        return requests.Request('GET', url, params=params).prepare().url
+
+    def _get(self, url, params, headers, timeout, **kwargs):
+        return self.session.get(
+            url,
+            params=params,
+            headers=headers,
+            timeout=timeout if timeout is not None else self.timeout,
+            **kwargs
+        )
+
+    def close(self):
+        self.session.close()
+
+
+_default_client = None
+_default_client_lock = threading.Lock()
+
+
+def get_client():
+    """Process-wide client so every module shares the same connection pools"""
+    global _default_client
+    with _default_client_lock:
+        if _default_client is None:
+            _default_client = HTTPClient(cache=HTTPCache())
+        return _default_client
@@ -0,0 +1,141 @@
+# src/utils/jd_extraction.py
+
+import html
+import json
+import re
+from urllib.parse import urlparse
+
+from bs4 import BeautifulSoup
+
+# --- Per-domain extractor registry -------------------------------------------
+
+EXTRACTORS = []   # (domain suffixes, fn(soup) -> text or None), checked in registration order
+
+
+def register_extractor(*domains):
+    """
+    Decorator: use fn(soup) for pages whose host is (or ends with) one of `domains`.
+    Registering with no domains adds a generic extractor tried on every page.
+    """
+    def decorator(fn):
+        EXTRACTORS.append((tuple(d.lower() for d in domains), fn))
+        return fn
+    return decorator
+
+
+def _host_matches(host, domains):
+    return not domains or any(host == d or host.endswith('.' + d) for d in domains)
+
+
+def _text(elem):
+    return elem.get_text('\n', strip=True) if elem else None
+
+
+@register_extractor('linkedin.com')
+def _linkedin(soup):
+    return _text(soup.find('div', class_='description__text') or
+                 soup.find('div', class_='show-more-less-html__markup') or
+                 soup.find('section', class_='description'))
+
+
+@register_extractor('indeed.com', 'indeed.co.uk')
+def _indeed(soup):
+    return _text(soup.find('div', id='jobDescriptionText'))
+
+
+@register_extractor('glassdoor.com', 'glassdoor.co.uk')
+def _glassdoor(soup):
+    return _text(soup.find('div', class_='jobDescriptionContent') or
+                 soup.find('div', class_=re.compile(r'JobDetails_jobDescription')))
+
+
+@register_extractor('greenhouse.io')
+def _greenhouse(soup):
+    return _text(soup.find('div', id='content') or soup.find('div', class_='job__description'))
+
+
+@register_extractor('lever.co')
+def _lever(soup):
+    sections = soup.find_all('div', class_='section-wrapper')
+    return '\n'.join(_text(s) for s in sections) if sections else None
+
+
+@register_extractor()
+def _json_ld(soup):
+    """schema.org JobPosting markup, which most career sites embed for search engines"""
+    for script in soup.find_all('script', type='application/ld+json'):
+        try:
+            data = json.loads(script.string or '')
+        except ValueError:
+            continue
+        for item in data if isinstance(data, list) else [data]:
+            if isinstance(item, dict) and item.get('@type') == 'JobPosting' and item.get('description'):
+                # Often entity-escaped HTML inside the JSON string
+                return _text(BeautifulSoup(html.unescape(item['description']), 'html.parser'))
+    return None
+
+
+@register_extractor()
+def _generic(soup):
+    return _text(soup.find('div', class_='description') or soup.find('div', id='job-description'))
+
+
+def extract_description(url, content):
+    """Run the extractors registered for the URL's host, then the generic ones, then the <p> fallback"""
+    soup = BeautifulSoup(content, 'html.parser')
+    host = urlparse(url).netloc.lower()
+    for domains, fn in sorted(EXTRACTORS, key=lambda entry: not entry[0]):
+        if _host_matches(host, domains):
+            text = fn(soup)
+            if text:
+                return text
+
+    # Fallback: try to find any large text block
+    long_paragraphs = [p.get_text(' ', strip=True) for p in soup.find_all('p')]
+    return '\n'.join(p for p in long_paragraphs if len(p) > 50)
+
+
+# --- Normalizer ----------------------------------------------------------------
+
+# Sentences that never help tailoring a CV: EEO statements, cookie/consent
+# banners, benefits blurbs and page chrome
+_BOILERPLATE = re.compile(r'''
+    equal[ -]opportunit | regardless\ of\ (?:race|age|gender|sex) | without\ regard\ to
+  | protected\ (?:characteristic|veteran|class) | reasonable\ (?:adjustment|accommodation)
+  | diversity\ (?:and|&)\ inclusion\ statement | disabilit(?:y|ies)\ confident | e-?verify
+  | cookies? | privacy\ (?:policy|notice) | terms\ of\ (?:use|service)
+  | (?:health|dental|vision|life)\ insurance | pension\ (?:scheme|plan|contribution) | 401\(?k\)?
+  | paid\ time\ off | holiday\ allowance | annual\ leave | parental\ leave | gym\ membership
+  | cycle\ to\ work | wellness\ (?:program|allowance|stipend) | free\ (?:snacks|lunch|breakfast)
+  | ^(?:show\ (?:more|less)|apply(?:\ now)?|save(?:\ job)?|share|report\ this\ job|sign\ in)$
+  | click\ here | seniority\ level | employment\ type | job\ function | industries$
+''', re.IGNORECASE | re.VERBOSE)
+
+_SENTENCE_SPLIT = re.compile(r'(?<=[.!?])\s+(?=[A-Z0-9•\-])|\n+')
+_BULLET = re.compile(r'^[\s•·\-\*–]+')
+
+
+def normalize_description(text):
+    """
+    Strip boilerplate sentences, drop repeated ones (same words ignoring case,
+    whitespace and bullets) and collapse whitespace; line structure is kept
+    so requirement lists stay readable.
+    """
+    if not text:
+        return ''
+    kept = []
+    seen = set()
+    for line in text.splitlines():
+        sentences = []
+        for sentence in _SENTENCE_SPLIT.split(line):
+            sentence = re.sub(r'\s+', ' ', _BULLET.sub('', sentence)).strip()
+            if not sentence or _BOILERPLATE.search(sentence):
+                continue
+            fingerprint = re.sub(r'\W+', ' ', sentence.lower()).strip()
+            if fingerprint in seen:
+                continue
+            seen.add(fingerprint)
+            sentences.append(sentence)
+        if sentences:
+            kept.append(' '.join(sentences))
+    return '\n'.join(kept)
@@ -0,0 +1,84 @@
+# src/utils/jd_store.py
+
+import hashlib
+import time
+import zlib
+
+from src.utils.sqlite_store import SQLiteStore
+
+
+class JDStore(SQLiteStore):
+    """
+    Content-addressed store of normalized job descriptions (SQLite).
+    - bodies are zlib-compressed and keyed by the sha256 of the text, so
+      reposts and multi-source duplicates of one JD are stored once
+    - a jobs table maps a posting's canonical ID to its description hash,
+      so later runs reuse the description without fetching or parsing
+    """
+
+    SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS descriptions (
+            sha TEXT PRIMARY KEY,
+            body BLOB,
+            chars INTEGER,
+            stored_size INTEGER,
+            stored_at REAL
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS jobs (
+            job_key TEXT PRIMARY KEY,
+            sha TEXT,
+            updated_at REAL
+        )
+        """,
+    )
+
+    def __init__(self, path='data/jobs/jd_store.sqlite'):
+        super().__init__(path)
+        self.stats = {'hits': 0, 'misses': 0, 'stores': 0, 'deduplicated': 0}
+
+    @staticmethod
+    def digest(text):
+        return hashlib.sha256(text.encode('utf-8')).hexdigest()
+
+    def get(self, job_key):
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT d.body FROM jobs j JOIN descriptions d ON d.sha = j.sha WHERE j.job_key = ?",
+                (job_key,)
+            ).fetchone()
+            self.stats['hits' if row else 'misses'] += 1
+        return zlib.decompress(row[0]).decode('utf-8') if row else None
+
+    def put(self, job_key, text):
+        """Store text (once per distinct content) and point job_key at it; returns the hash"""
+        sha = self.digest(text)
+        now = time.time()
+        with self._lock:
+            exists = self._conn.execute("SELECT 1 FROM descriptions WHERE sha = ?", (sha,)).fetchone()
+            if exists:
+                self.stats['deduplicated'] += 1
+            else:
+                body = zlib.compress(text.encode('utf-8'), 9)
+                self._conn.execute(
+                    "INSERT INTO descriptions VALUES (?, ?, ?, ?, ?)", (sha, body, len(text), len(body), now)
+                )
+                self.stats['stores'] += 1
+            if job_key:
+                self._conn.execute("INSERT OR REPLACE INTO jobs VALUES (?, ?, ?)", (job_key, sha, now))
+            self._conn.commit()
+        return sha
+
+    def size(self):
+        with self._lock:
+            return self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(chars), 0), COALESCE(SUM(stored_size), 0) FROM descriptions"
+            ).fetchone()
+
+    def print_stats(self):
+        count, chars, stored = self.size()
+        print("\n📚 JD STORE:")
+        print(f"   Reused: {self.stats['hits']}  New: {self.stats['stores']}  Duplicate content: {self.stats['deduplicated']}")
+        print(f"   {count} descriptions, {chars / 1024:.1f} KB text in {stored / 1024:.1f} KB on disk")
@@ -0,0 +1,170 @@
+# src/utils/job_identity.py
+
+import re
+import zlib
+from urllib.parse import urlsplit, urlunsplit
+
+import numpy as np
+
+# LinkedIn view URLs end in the numeric posting ID:
+#   https://uk.linkedin.com/jobs/view/ai-intern-at-acme-4012345678
+_LINKEDIN_VIEW_ID = re.compile(r'/jobs/view/(?:[^/?#]*-)?(\d{6,})')
+_LINKEDIN_QUERY_ID = re.compile(r'[?&](?:currentJobId|jobId)=(\d{6,})')
+
+# Greenhouse: boards.greenhouse.io/<co>/jobs/<id>, job-boards.greenhouse.io/..., or ?gh_jid=<id> on company sites
+_GREENHOUSE_PATH_ID = re.compile(r'greenhouse\.io/[^/?#]+/jobs/(\d+)')
+_GREENHOUSE_QUERY_ID = re.compile(r'[?&]gh_jid=(\d+)')
+
+# Lever: jobs.lever.co/<co>/<posting uuid>[/apply]
+_LEVER_ID = re.compile(r'lever\.co/[^/?#]+/([0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})', re.IGNORECASE)
+
+
+def normalize_url(url):
+    """Lowercase scheme/host, drop query string, fragment and trailing slash"""
+    parts = urlsplit(url.strip())
+    path = parts.path.rstrip('/') or '/'
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), path, '', ''))
+
+
+def canonical_job_id(url):
+    """
+    Stable identity for a posting regardless of tracking parameters or subdomain.
+    e.g. 'linkedin:4012345678', 'greenhouse:5551234', 'lever:<uuid>',
+    otherwise 'url:<normalized url>'
+    """
+    if not url:
+        return None
+    if 'linkedin.com' in url:
+        match = _LINKEDIN_VIEW_ID.search(url) or _LINKEDIN_QUERY_ID.search(url)
+        if match:
+            return f"linkedin:{match.group(1)}"
+    match = _GREENHOUSE_PATH_ID.search(url) or _GREENHOUSE_QUERY_ID.search(url)
+    if match:
+        return f"greenhouse:{match.group(1)}"
+    match = _LEVER_ID.search(url)
+    if match:
+        return f"lever:{match.group(1).lower()}"
+    return f"url:{normalize_url(url)}"
+
+
+# --- Near-duplicate detection -------------------------------------------------
+
+_WORD = re.compile(r'[a-z0-9+#]+')
+
+# Company suffixes and title variants that shouldn't make two postings look different
+_COMPANY_SUFFIXES = {'ltd', 'limited', 'inc', 'plc', 'llc', 'llp', 'uk', 'gmbh', 'co', 'corp', 'group'}
+_TOKEN_ALIASES = {
+    'internship': 'intern',
+    'interns': 'intern',
+    'placements': 'placement',
+    'trainees': 'trainee',
+    'artificial': 'ai',
+}
+_TOKEN_STOPWORDS = {'intelligence', 'the', 'a', 'an', 'and', 'of', 'at', 'in', 'for', 'to', 'with'}
+
+
+def normalize_tokens(text):
+    tokens = []
+    for token in _WORD.findall(text.lower()):
+        token = _TOKEN_ALIASES.get(token, token)
+        if token not in _TOKEN_STOPWORDS:
+            tokens.append(token)
+    return tokens
+
+
+def company_key(company):
+    """'Acme Ltd', 'ACME Limited' and 'Acme' all map to 'acme'"""
+    return ' '.join(t for t in normalize_tokens(company or '') if t not in _COMPANY_SUFFIXES)
+
+
+def job_shingles(job):
+    """
+    Shingle set for a job: title words and word pairs, plus word 3-grams of
+    the description when we have one. The company is matched exactly via
+    company_key() instead, so the same title at two companies never collides.
+    """
+    head = normalize_tokens(job.get('title', ''))
+    shingles = set(head)
+    shingles.update(' '.join(pair) for pair in zip(head, head[1:]))
+
+    body = normalize_tokens(job.get('description', ''))
+    shingles.update('d:' + ' '.join(body[i:i + 3]) for i in range(len(body) - 2))
+    return shingles
+
+
+# 31-bit Mersenne prime keeps (a * x + b) inside uint64 for the vectorised hash family
+_MERSENNE_PRIME = np.uint64((1 << 31) - 1)
+
+
+def _shingle_hashes(shingles):
+    return np.fromiter(
+        (zlib.crc32(s.encode('utf-8')) & 0x7FFFFFFF for s in shingles),
+        dtype=np.uint64,
+        count=len(shingles)
+    )
+
+
+class NearDuplicateDetector:
+    """
+    MinHash signatures + LSH banding over job shingles.
+    Each add/query only compares against jobs sharing at least one band bucket
+    (within the same group, e.g. company), so deduping N jobs costs roughly
+    O(N) instead of O(N^2).
+    """
+
+    def __init__(self, num_perm=64, bands=16, threshold=0.7, seed=1):
+        if num_perm % bands:
+            raise ValueError("num_perm must be divisible by bands")
+        self.num_perm = num_perm
+        self.bands = bands
+        self.rows = num_perm // bands
+        self.threshold = threshold
+
+        # Fixed-seed universal hash family: h_i(x) = (a_i * x + b_i) mod p
+        # (seeded so signatures are stable across runs and processes)
+        rng = np.random.RandomState(seed)
+        prime = int(_MERSENNE_PRIME)
+        self._a = rng.randint(1, prime, size=num_perm).astype(np.uint64)[:, None]
+        self._b = rng.randint(0, prime, size=num_perm).astype(np.uint64)[:, None]
+
+        self.buckets = [{} for _ in range(bands)]
+        self.signatures = {}
+
+    def signature(self, shingles):
+        if not shingles:
+            return None
+        hashes = _shingle_hashes(shingles)
+        # (num_perm x n) permuted hashes in one shot, min over each row
+        permuted = (self._a * hashes[None, :] + self._b) % _MERSENNE_PRIME
+        return tuple(permuted.min(axis=1).tolist())
+
+    def _bands(self, signature):
+        for band in range(self.bands):
+            yield band, signature[band * self.rows:(band + 1) * self.rows]
+
+    @staticmethod
+    def similarity(sig_a, sig_b):
+        """Estimated Jaccard similarity of two signatures"""
+        return sum(1 for x, y in zip(sig_a, sig_b) if x == y) / len(sig_a)
+
+    def query(self, signature, group=None):
+        """Best (key, similarity) at or above the threshold, or None"""
+        if signature is None:
+            return None
+        candidates = set()
+        for band, rows in self._bands(signature):
+            candidates.update(self.buckets[band].get((group, rows), ()))
+        best = None
+        for key in candidates:
+            score = self.similarity(signature, self.signatures[key])
+            if score >= self.threshold and (best is None or score > best[1]):
+                best = (key, score)
+        return best
+
+    def add(self, key, signature, group=None):
+        if signature is None:
+            return
+        self.signatures[key] = signature
+        for band, rows in self._bands(signature):
+            self.buckets[band].setdefault((group, rows), []).append(key)
+
@@ -0,0 +1,217 @@
+# src/utils/json_stream.py
+
+import codecs
+import json
+import re
+
+_WHITESPACE_AND_COMMAS = ' \t\n\r,'
+
+
+def iter_json_array(chunks, key=None):
+    """
+    Yield the elements of a JSON array one at a time from an iterable of
+    byte/str chunks (e.g. response.iter_content()), without loading the whole
+    payload. With `key`, the array is the value of the first "key": [...] in
+    the document (e.g. Greenhouse's {"jobs": [...]}); otherwise the document
+    itself must be an array (e.g. Lever).
+    """
+    decoder = json.JSONDecoder()
+    utf8 = codecs.getincrementaldecoder('utf-8')()
+    start = re.compile(r'"%s"\s*:\s*\[' % re.escape(key)) if key else re.compile(r'\s*\[')
+
+    chunks = iter(chunks)
+    buf = ''
+    exhausted = False
+
+    def read_more():
+        nonlocal buf, exhausted
+        for chunk in chunks:
+            if not chunk:
+                continue
+            buf += utf8.decode(chunk) if isinstance(chunk, bytes) else chunk
+            return True
+        buf += utf8.decode(b'', final=True)
+        exhausted = True
+        return False
+
+    # 1. Find the opening bracket of the array
+    while True:
+        match = start.search(buf) if key else start.match(buf)
+        if match:
+            buf = buf[match.end():]
+            break
+        if exhausted:
+            return
+        if not key and buf.strip() and not buf.lstrip().startswith('['):
+            raise ValueError("JSON document is not an array")
+        read_more()
+
+    # 2. Decode one element at a time
+    while True:
+        buf = buf.lstrip(_WHITESPACE_AND_COMMAS)
+        if buf.startswith(']'):
+            return
+        if buf:
+            try:
+                item, end = decoder.raw_decode(buf)
+            except ValueError:
+                # Element not complete yet
+                if exhausted:
+                    raise
+            else:
+                # A bare number at the end of the buffer may continue in the next chunk
+                if end < len(buf) or exhausted or isinstance(item, (dict, list, str)):
+                    yield item
+                    buf = buf[end:]
+                    continue
+        if exhausted:
+            raise ValueError("Unexpected end of JSON array")
+        read_more()
+
+
+class ObjectMemberScanner:
+    """
+    Incremental scanner over the text of ONE JSON object arriving in chunks
+    (e.g. a streamed LLM response). feed() returns the top-level members that
+    have just become complete, as (key, value) pairs, so a caller can act on
+    an early member (say "job_analysis") before the rest has been generated.
+    Only members named in `keys` are decoded (all of them if keys is None).
+    """
+
+    def __init__(self, keys=None):
+        self.keys = set(keys) if keys is not None else None
+        self.buf = ''
+        self.pos = 0
+        self.depth = 0
+        self.in_string = False
+        self.escape = False
+        self.expecting_key = False
+        self.string_start = None
+        self.key = None
+        self.value_start = None
+        self.members = {}
+
+    def _emit(self, end, found):
+        key, raw = self.key, self.buf[self.value_start:end]
+        self.value_start = None
+        if self.keys is None or key in self.keys:
+            value = json.loads(raw)
+            self.members[key] = value
+            found.append((key, value))
+
+    def feed(self, text):
+        self.buf += text
+        found = []
+        buf = self.buf
+        while self.pos < len(buf):
+            ch = buf[self.pos]
+            if self.in_string:
+                if self.escape:
+                    self.escape = False
+                elif ch == '\\':
+                    self.escape = True
+                elif ch == '"':
+                    self.in_string = False
+                    if self.depth == 1 and self.expecting_key:
+                        self.key = json.loads(buf[self.string_start:self.pos + 1])
+                    elif self.depth == 1 and self.value_start is not None:
+                        # A top-level string value is complete at its closing quote
+                        self._emit(self.pos + 1, found)
+            elif ch == '"':
+                self.in_string = True
+                self.string_start = self.pos
+            elif ch in '{[':
+                self.depth += 1
+                if self.depth == 1:
+                    self.expecting_key = True
+            elif ch in '}]':
+                self.depth -= 1
+                if self.depth == 1 and self.value_start is not None:
+                    self._emit(self.pos + 1, found)
+                elif self.depth == 0 and self.value_start is not None:
+                    # Scalar that was the last member
+                    self._emit(self.pos, found)
+            elif self.depth == 1:
+                if ch == ':':
+                    self.expecting_key = False
+                    self.value_start = self.pos + 1
+                elif ch == ',':
+                    if self.value_start is not None:
+                        self._emit(self.pos, found)
+                    self.expecting_key = True
+            self.pos += 1
+        return found
+
+
+_FENCE = re.compile(r'^\s*```(?:json)?\s*|\s*```\s*$')
+_TRAILING_COMMA = re.compile(r',(\s*[}\]])')
+
+
+def repair_json(text):
+    """
+    Parse LLM output that should be one JSON object but may be wrapped in code
+    fences, carry trailing commas, or be cut off mid-way (token limit, aborted
+    stream). A truncated document is cut back to the last complete value and
+    its open objects/arrays are closed, so everything generated before the cut
+    survives. Returns (value, repaired); raises ValueError if nothing parses.
+    """
+    text = _FENCE.sub('', text or '')
+    starts = [k for k in (text.find('{'), text.find('[')) if k >= 0]
+    if not starts:
+        raise ValueError("No JSON object in model output")
+    text = text[min(starts):]
+    try:
+        return json.loads(text), False
+    except ValueError:
+        pass
+
+    cleaned = _TRAILING_COMMA.sub(r'\1', text)
+    try:
+        return json.loads(cleaned), True
+    except ValueError:
+        pass
+
+    # Truncated: find every point where a value inside a container just ended,
+    # with the closers needed at that point, and try them from the end backwards
+    cuts = []
+    stack = []          # '}' / ']' closers
+    expecting_key = []  # per open object: is the next string a key?
+    in_string = escape = False
+    is_key = False
+    for pos, ch in enumerate(cleaned):
+        if in_string:
+            if escape:
+                escape = False
+            elif ch == '\\':
+                escape = True
+            elif ch == '"':
+                in_string = False
+                if not is_key and stack:
+                    cuts.append((pos + 1, ''.join(reversed(stack))))
+            continue
+        if ch == '"':
+            in_string = True
+            is_key = bool(stack) and stack[-1] == '}' and expecting_key[-1]
+        elif ch in '{[':
+            stack.append('}' if ch == '{' else ']')
+            expecting_key.append(ch == '{')
+        elif ch in '}]':
+            if not stack:
+                break
+            stack.pop()
+            expecting_key.pop()
+            if stack:
+                cuts.append((pos + 1, ''.join(reversed(stack))))
+        elif ch == ':' and stack:
+            expecting_key[-1] = False
+        elif ch == ',' and stack:
+            # A scalar (or anything else) before this comma is complete
+            cuts.append((pos, ''.join(reversed(stack))))
+            expecting_key[-1] = stack[-1] == '}'
+
+    for pos, closers in reversed(cuts[-200:]):
+        try:
+            return json.loads(_TRAILING_COMMA.sub(r'\1', cleaned[:pos].rstrip().rstrip(',') + closers)), True
+        except ValueError:
+            continue
+    raise ValueError("Model output is not repairable JSON")
@@ -0,0 +1,109 @@
+# src/utils/linkedin_parser.py
+
+from collections import namedtuple
+
+from bs4 import BeautifulSoup
+
+# lxml is optional: when it's missing we fall back to BeautifulSoup.
+try:
+    import lxml.html
+    from lxml import etree
+    HAS_LXML = True
+except ImportError:
+    HAS_LXML = False
+
+# Compact per-card record. Missing optional fields are None.
+JobCard = namedtuple('JobCard', ['title', 'company', 'location', 'url', 'date_posted'])
+
+
+def _clean_url(url):
+    return url.split('?')[0] if '?' in url else url
+
+
+def _has_class(cls):
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')"
+
+
+if HAS_LXML:
+    # Compiled once; only the base-card subtrees are ever walked.
+    _XP_CARDS = etree.XPath(f"//div[{_has_class('base-card')}]")
+    _XP_TITLE = etree.XPath(f".//h3[{_has_class('base-search-card__title')}]")
+    _XP_COMPANY = etree.XPath(f".//h4[{_has_class('base-search-card__subtitle')}]")
+    _XP_LOCATION = etree.XPath(f".//span[{_has_class('job-search-card__location')}]")
+    _XP_LINK = etree.XPath(f".//a[{_has_class('base-card__full-link')}]")
+    _XP_DATE = etree.XPath(f".//time[{_has_class('job-search-card__listdate')}]")
+
+
+def parse_job_cards_lxml(content):
+    """Fast path: lxml (C parser) + precompiled XPath over the base-card nodes"""
+    if not content or not content.strip():
+        return []
+    root = lxml.html.document_fromstring(content)
+    cards = []
+    for card in _XP_CARDS(root):
+        title = _XP_TITLE(card)
+        company = _XP_COMPANY(card)
+        link = _XP_LINK(card)
+        if not (title and company and link):
+            continue
+        location = _XP_LOCATION(card)
+        date = _XP_DATE(card)
+        cards.append(JobCard(
+            title[0].text_content().strip(),
+            company[0].text_content().strip(),
+            location[0].text_content().strip() if location else None,
+            _clean_url(link[0].get('href', '')),
+            date[0].get('datetime') if date else None,
+        ))
+    return cards
+
+
+def _card_from_soup(base_card):
+    title_elem = base_card.find('h3', class_='base-search-card__title')
+    company_elem = base_card.find('h4', class_='base-search-card__subtitle')
+    location_elem = base_card.find('span', class_='job-search-card__location')
+    link_elem = base_card.find('a', class_='base-card__full-link')
+    date_elem = base_card.find('time', class_='job-search-card__listdate')
+    if not (title_elem and company_elem and link_elem):
+        return None
+    return JobCard(
+        title_elem.text.strip(),
+        company_elem.text.strip(),
+        location_elem.text.strip() if location_elem else None,
+        _clean_url(link_elem.get('href', '')),
+        date_elem.get('datetime') if date_elem else None,
+    )
+
+
+def parse_job_cards_full(content):
+    """
+    Fallback when lxml is missing, and the reference the lxml path must match:
+    the original full-document BeautifulSoup parse (find_all('li') + per-card .find).
+    A SoupStrainer over the base-card nodes was tried and measured slower.
+    """
+    soup = BeautifulSoup(content, 'html.parser')
+    cards = []
+    for card in soup.find_all('li'):
+        base_card = card.find('div', class_='base-card')
+        if not base_card:
+            continue
+        card = _card_from_soup(base_card)
+        if card:
+            cards.append(card)
+    return cards
+
+
+PARSERS = {
+    'lxml': parse_job_cards_lxml,
+    'bs4': parse_job_cards_full,
+}
+
+DEFAULT_BACKEND = 'lxml' if HAS_LXML else 'bs4'
+
+
+def parse_job_cards(content, backend=None):
+    """Extract JobCard tuples from a LinkedIn search results page"""
+    backend = backend or DEFAULT_BACKEND
+    if backend == 'lxml' and not HAS_LXML:
+        backend = 'bs4'
+    return PARSERS[backend](content)
@@ -0,0 +1,110 @@
+# src/utils/llm_cache.py
+
+import hashlib
+import json
+import re
+import time
+import zlib
+
+from src.utils.sqlite_store import SQLiteStore
+
+
+def normalize_text(text):
+    """Collapse whitespace so cosmetic re-renders of the same JD hash identically"""
+    return re.sub(r'\s+', ' ', text or '').strip()
+
+
+def make_key(*parts):
+    """sha256 over a canonical JSON encoding of the inputs that determine the response"""
+    canonical = json.dumps(parts, sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    return hashlib.sha256(canonical.encode('utf-8')).hexdigest()
+
+
+class LLMResponseCache(SQLiteStore):
+    """
+    Content-addressed, on-disk (SQLite) cache of parsed LLM responses.
+    - the key is a hash of everything that shapes the output (prompt version,
+      model, inputs), so a changed CV or JD simply misses
+    - bounded by age (max_age_days) and size (max_bytes, LRU eviction)
+    - stats: hits, misses, stores, evictions, tokens saved
+    """
+
+    SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS responses (
+            key TEXT PRIMARY KEY,
+            model TEXT,
+            body BLOB,
+            stored_size INTEGER,
+            tokens INTEGER,
+            stored_at REAL,
+            last_access REAL
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_llm_access ON responses(last_access)",
+    )
+
+    def __init__(self, path='data/cache/llm_cache.sqlite', max_bytes=50 * 1024 * 1024, max_age_days=30):
+        super().__init__(path)
+        self.max_bytes = max_bytes
+        self.max_age = max_age_days * 86400 if max_age_days else None
+        self.stats = {
+            'hits': 0,
+            'misses': 0,
+            'stores': 0,
+            'evictions': 0,
+            'tokens_saved': 0,
+        }
+
+    def get(self, key):
+        """Return the cached value for key, or None (expired entries count as misses)"""
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, tokens, stored_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row and self.max_age is not None and now - row[2] > self.max_age:
+                self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+                self._conn.commit()
+                self.stats['evictions'] += 1
+                row = None
+            if not row:
+                self.stats['misses'] += 1
+                return None
+            body, tokens, _ = row
+            self.stats['hits'] += 1
+            self.stats['tokens_saved'] += tokens or 0
+            self._conn.execute("UPDATE responses SET last_access = ? WHERE key = ?", (now, key))
+            self._conn.commit()
+        return json.loads(zlib.decompress(body).decode('utf-8'))
+
+    def put(self, key, value, model=None, tokens=None):
+        body = zlib.compress(json.dumps(value, ensure_ascii=False).encode('utf-8'))
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, model, body, len(body), tokens, now, now)
+            )
+            self.stats['stores'] += 1
+            self._evict(now)
+            self._conn.commit()
+
+    def _evict(self, now):
+        """Drop expired entries, then least-recently-used ones until under max_bytes (lock held)"""
+        if self.max_age is not None:
+            cursor = self._conn.execute("DELETE FROM responses WHERE stored_at < ?", (now - self.max_age,))
+            self.stats['evictions'] += cursor.rowcount
+        self.stats['evictions'] += self._evict_lru('responses', self.max_bytes)
+
+    def report(self):
+        stats = dict(self.stats)
+        lookups = stats['hits'] + stats['misses']
+        stats['hit_rate'] = stats['hits'] / lookups if lookups else 0.0
+        return stats
+
+    def print_stats(self):
+        stats = self.report()
+        print("\n🧠 LLM CACHE:")
+        print(f"   Hits: {stats['hits']}  Misses: {stats['misses']}  Hit rate: {stats['hit_rate']:.0%}")
+        print(f"   Tokens saved: {stats['tokens_saved']}  Evictions: {stats['evictions']}")
@@ -0,0 +1,80 @@
+# src/utils/llm_scheduler.py
+
+import threading
+import time
+from collections import deque
+
+
+def estimate_tokens(text):
+    """Cheap local estimate (~4 chars per token for English/JSON)"""
+    return max(1, len(text) // 4)
+
+
+class QuotaScheduler:
+    """
+    Admission control for LLM calls against requests-per-minute and
+    tokens-per-minute quotas, over a sliding 60 s window.
+    Callers reserve an estimated token count before the call and settle the
+    real usage afterwards, so later admissions use actual numbers.
+    Either quota may be None (unlimited).
+    """
+
+    WINDOW = 60.0
+
+    def __init__(self, rpm=None, tpm=None):
+        self.rpm = rpm
+        self.tpm = tpm
+        self._window = deque()   # [timestamp, tokens] per admitted request
+        self._cond = threading.Condition()
+        self.stats = {'requests': 0, 'tokens': 0, 'waited_seconds': 0.0}
+
+    def _prune(self, now):
+        while self._window and now - self._window[0][0] >= self.WINDOW:
+            self._window.popleft()
+
+    def _wait_time(self, now, tokens):
+        """Seconds until a request of `tokens` fits both quotas (0 if it fits now)"""
+        wait = 0.0
+        if self.rpm and len(self._window) >= self.rpm:
+            wait = max(wait, self._window[len(self._window) - self.rpm][0] + self.WINDOW - now)
+        if self.tpm:
+            used = sum(entry[1] for entry in self._window)
+            if used + tokens > self.tpm and self._window:
+                if tokens > self.tpm:
+                    # A single request larger than the whole quota never fits: it goes
+                    # alone, once the newest entry has left the window
+                    wait = max(wait, self._window[-1][0] + self.WINDOW - now)
+                else:
+                    excess = used + tokens - self.tpm
+                    for ts, n in self._window:
+                        excess -= n
+                        if excess <= 0:
+                            wait = max(wait, ts + self.WINDOW - now)
+                            break
+        return wait
+
+    def acquire(self, estimated_tokens=0):
+        """Block until the request fits; returns a reservation for settle()"""
+        started = time.monotonic()
+        with self._cond:
+            while True:
+                now = time.monotonic()
+                self._prune(now)
+                wait = self._wait_time(now, estimated_tokens)
+                if wait <= 0:
+                    break
+                self._cond.wait(timeout=wait)
+            reservation = [now, estimated_tokens]
+            self._window.append(reservation)
+            self.stats['requests'] += 1
+            self.stats['waited_seconds'] += time.monotonic() - started
+            return reservation
+
+    def settle(self, reservation, actual_tokens):
+        """Replace the estimate with the real token count once the response is in"""
+        if actual_tokens is None:
+            return
+        with self._cond:
+            reservation[1] = actual_tokens
+            self.stats['tokens'] += actual_tokens
+            self._cond.notify_all()
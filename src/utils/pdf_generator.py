@@ -1,11 +1,36 @@
 # src/utils/pdf_generator.py
 
+from concurrent.futures import ProcessPoolExecutor
 from fpdf import FPDF
 import json
+import os
+import time
+
+# Part of every document's hash in the render manifest: bump when the layout
+# below changes so existing PDFs are rebuilt
+TEMPLATE_VERSION = 'resume-v2'
+
+
+def render_to_bytes(cv_data, job_title, company_name):
+    """The resume PDF as bytes, without touching disk (e.g. to stream it to a client)"""
+    return bytes(PDFGenerator()._build(cv_data, job_title, company_name).output())
+
+
+def _render_task(task):
+    """Process-pool worker: (index, cv_data, title, company) -> (index, pdf bytes, seconds, error)"""
+    index, cv_data, job_title, company_name = task
+    started = time.perf_counter()
+    try:
+        data = render_to_bytes(cv_data, job_title, company_name)
+        return index, data, time.perf_counter() - started, None
+    except Exception as e:
+        return index, None, time.perf_counter() - started, f"{type(e).__name__}: {e}"
+
 
 class PDFGenerator:
-    def __init__(self):
-        pass
+    def __init__(self, manifest=None):
+        # Optional RenderManifest: documents whose content hash is unchanged are not rebuilt
+        self.manifest = manifest
         
     class PDF(FPDF):
         def header(self):
@@ -19,6 +44,94 @@ class PDFGenerator:
 
     def generate_resume_pdf(self, cv_data, job_title, company_name):
         """Generate a PDF resume from the tailored CV JSON data"""
+        safe_filename = self.output_path(job_title, company_name)
+        digest = None
+        if self.manifest is not None:
+            digest = self.manifest.digest(cv_data, job_title, company_name, TEMPLATE_VERSION)
+            if self.manifest.is_current(safe_filename, digest):
+                print(f"  ⏭️  Unchanged, kept: {safe_filename}")
+                return
+        os.makedirs(os.path.dirname(safe_filename), exist_ok=True)
+        
+        self._build(cv_data, job_title, company_name).output(safe_filename)
+        print(f"  📄 Generated PDF: {safe_filename}")
+        if self.manifest is not None:
+            self.manifest.record(safe_filename, digest)
+            self.manifest.save()
+    
+    @staticmethod
+    def output_path(job_title, company_name):
+        filename = f"data/resumes/generated/CV_{company_name}_{job_title}.pdf"
+        # Sanitize filename
+        return "".join([c for c in filename if c.isalpha() or c.isdigit() or c in (' ', '-', '_', '.', '/')]).replace(' ', '_')
+    
+    def render_all(self, jobs, workers=None):
+        """
+        Render many CVs in parallel: layout is CPU-bound, so jobs are spread over
+        a process pool sized to the available cores (workers=1 renders inline).
+        `jobs` are (cv_data, job_title, company_name) tuples. Workers return PDF
+        bytes, written here; returns one dict per job, in order, with its path,
+        seconds, error (None on success) and whether it was skipped as unchanged
+        (with a manifest, only new or changed documents are rendered).
+        """
+        reports = [None] * len(jobs)
+        digests = {}
+        tasks = []
+        for i, (cv_data, title, company) in enumerate(jobs):
+            if self.manifest is not None:
+                path = self.output_path(title, company)
+                digests[i] = self.manifest.digest(cv_data, title, company, TEMPLATE_VERSION)
+                if self.manifest.is_current(path, digests[i]):
+                    reports[i] = {'title': title, 'company': company, 'path': path, 'seconds': 0.0,
+                                  'error': None, 'skipped': True}
+                    continue
+            tasks.append((i, cv_data, title, company))
+        
+        workers = min(workers or os.cpu_count() or 1, len(tasks)) or 1
+        started = time.perf_counter()
+        if workers == 1:
+            rendered = map(_render_task, tasks)
+            executor = None
+        else:
+            executor = ProcessPoolExecutor(max_workers=workers)
+            # Several documents per round trip keeps IPC overhead small for big batches
+            rendered = executor.map(_render_task, tasks, chunksize=max(1, len(tasks) // (workers * 4)))
+        
+        try:
+            for index, data, seconds, error in rendered:
+                _, title, company = jobs[index]
+                path = None
+                if error is None:
+                    path = self.output_path(title, company)
+                    try:
+                        os.makedirs(os.path.dirname(path), exist_ok=True)
+                        with open(path, 'wb') as f:
+                            f.write(data)
+                        print(f"  📄 Generated PDF: {path} ({seconds:.2f}s)")
+                        if self.manifest is not None:
+                            self.manifest.record(path, digests[index])
+                    except OSError as e:
+                        error = f"{type(e).__name__}: {e}"
+                if error is not None:
+                    print(f"  ❌ Error generating PDF for {company}: {error}")
+                reports[index] = {'title': title, 'company': company, 'path': path if error is None else None,
+                                  'seconds': seconds, 'error': error, 'skipped': False}
+        finally:
+            if executor is not None:
+                executor.shutdown()
+            if self.manifest is not None:
+                self.manifest.save()
+        
+        elapsed = time.perf_counter() - started
+        cpu = sum(r['seconds'] for r in reports if r)
+        failed = sum(1 for r in reports if r and r['error'])
+        skipped = len(jobs) - len(tasks)
+        print(f"  ⏱️  {len(tasks) - failed}/{len(tasks)} PDFs rendered in {elapsed:.1f}s on {workers} worker(s) "
+              f"({cpu:.1f}s of rendering, avg {cpu / max(1, len(tasks)):.2f}s per CV); {skipped} unchanged, skipped")
+        return reports
+    
+    def _build(self, cv_data, job_title, company_name):
+        """Lay out the resume and return the FPDF document"""
         
         pdf = self.PDF()
         pdf.add_page()
@@ -48,7 +161,7 @@ class PDFGenerator:
         pdf.set_font('Helvetica', 'B', 14)
         pdf.cell(0, 10, 'Professional Summary', new_x="LMARGIN", new_y="NEXT")
         pdf.set_font('Helvetica', '', 11)
-        pdf.multi_cell(0, 6, cv_data.get('professional_summary', ''))
+        pdf.multi_cell(0, 6, cv_data.get('professional_summary', ''), new_x="LMARGIN", new_y="NEXT")
         pdf.ln(5)
         
         # --- Skills ---
@@ -61,7 +174,7 @@ class PDFGenerator:
                 pdf.set_font('Helvetica', 'B', 11)
                 pdf.cell(40, 6, category + ":", new_x="RIGHT", new_y="TOP")
                 pdf.set_font('Helvetica', '', 11)
-                pdf.multi_cell(0, 6, ", ".join(skill_list))
+                pdf.multi_cell(0, 6, ", ".join(skill_list), new_x="LMARGIN", new_y="NEXT")
         pdf.ln(5)
         
         # --- Experience/Projects ---
@@ -80,13 +193,13 @@ class PDFGenerator:
             pdf.cell(0, 6, f"Stack: {tech}", new_x="LMARGIN", new_y="NEXT")
             
             pdf.set_font('Helvetica', '', 11)
-            pdf.multi_cell(0, 6, proj.get('description', ''))
+            pdf.multi_cell(0, 6, proj.get('description', ''), new_x="LMARGIN", new_y="NEXT")
             
             # Achievements
             pdf.set_font('Helvetica', '', 10)
             for bullet in proj.get('achievements', []):
                 pdf.cell(5) # indent
-                pdf.multi_cell(0, 5, f"- {bullet}")
+                pdf.multi_cell(0, 5, f"- {bullet}", new_x="LMARGIN", new_y="NEXT")
             pdf.ln(3)
             
         # --- Education ---
@@ -98,7 +211,7 @@ class PDFGenerator:
         pdf.set_font('Helvetica', '', 11)
         pdf.cell(0, 6, f"{edu.get('degree', '')} ({edu.get('graduation', '')})", new_x="LMARGIN", new_y="NEXT")
         if edu.get('relevant_coursework'):
-             pdf.multi_cell(0, 6, "Coursework: " + ", ".join(edu['relevant_coursework']))
+             pdf.multi_cell(0, 6, "Coursework: " + ", ".join(edu['relevant_coursework']), new_x="LMARGIN", new_y="NEXT")
         pdf.ln(5)
         
         # --- Certifications ---
@@ -108,17 +221,9 @@ class PDFGenerator:
             pdf.cell(0, 10, 'Certifications', new_x="LMARGIN", new_y="NEXT")
             pdf.set_font('Helvetica', '', 11)
             for cert in certifications:
-                pdf.multi_cell(0, 6, f"- {cert.get('name', '')} ({cert.get('issuer', '')})")
+                pdf.multi_cell(0, 6, f"- {cert.get('name', '')} ({cert.get('issuer', '')})", new_x="LMARGIN", new_y="NEXT")
 
-        # Save
-        filename = f"data/resumes/generated/CV_{company_name}_{job_title}.pdf"
-        # Sanitize filename
-        safe_filename = "".join([c for c in filename if c.isalpha() or c.isdigit() or c in (' ', '-', '_', '.', '/')]).replace(' ', '_')
-        import os
-        os.makedirs(os.path.dirname(safe_filename), exist_ok=True)
-        
-        pdf.output(safe_filename)
-        print(f"  📄 Generated PDF: {safe_filename}")
+        return pdf
 
 if __name__ == "__main__":
     # Test
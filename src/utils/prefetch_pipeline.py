@@ -0,0 +1,93 @@
+# src/utils/prefetch_pipeline.py
+
+import queue
+import threading
+import time
+
+_DONE = object()
+
+
+class PrefetchPipeline:
+    """
+    Producer/consumer stage: `workers` threads run produce(item) ahead of the
+    consumer and park results in a bounded queue (at most `depth` waiting).
+    Iterating run(items) yields (item, result) pairs in completion order.
+    Stats show which side is the bottleneck:
+    - producer_idle: seconds producers sat blocked on a full queue (consumer is slower)
+    - consumer_idle: seconds the consumer waited on an empty queue (producers are slower)
+    - avg_depth / max_depth: queue depth seen by the consumer at each take
+    """
+
+    def __init__(self, produce, depth=4, workers=2, name='prefetch'):
+        self.produce = produce
+        self.depth = max(1, depth)
+        self.workers = max(1, workers)
+        self.name = name
+        self.stats = {'produced': 0, 'errors': 0, 'producer_idle': 0.0, 'consumer_idle': 0.0,
+                      'max_depth': 0, 'avg_depth': 0.0}
+
+    def run(self, items):
+        items = iter(items)
+        q = queue.Queue(maxsize=self.depth)
+        stop = threading.Event()
+        lock = threading.Lock()
+
+        def put(entry):
+            started = time.monotonic()
+            while not stop.is_set():
+                try:
+                    q.put(entry, timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+            with lock:
+                self.stats['producer_idle'] += time.monotonic() - started
+
+        def worker():
+            while not stop.is_set():
+                with lock:
+                    item = next(items, _DONE)
+                if item is _DONE:
+                    break
+                try:
+                    result = self.produce(item)
+                except Exception as e:
+                    with lock:
+                        self.stats['errors'] += 1
+                    result = e
+                with lock:
+                    self.stats['produced'] += 1
+                put((item, result))
+            put(_DONE)
+
+        threads = [threading.Thread(target=worker, name=f"{self.name}-{n}", daemon=True) for n in range(self.workers)]
+        for thread in threads:
+            thread.start()
+
+        finished = 0
+        takes = 0
+        depth_total = 0
+        try:
+            while finished < len(threads):
+                depth = q.qsize()
+                started = time.monotonic()
+                entry = q.get()
+                self.stats['consumer_idle'] += time.monotonic() - started
+                if entry is _DONE:
+                    finished += 1
+                    continue
+                takes += 1
+                depth_total += depth
+                self.stats['max_depth'] = max(self.stats['max_depth'], depth)
+                self.stats['avg_depth'] = depth_total / takes
+                yield entry
+        finally:
+            # Consumer stopped early (or finished): release any blocked producers
+            stop.set()
+
+    def print_stats(self):
+        stats = self.stats
+        print(f"   ⛓️  {self.name}: {stats['produced']} produced ({stats['errors']} errors), "
+              f"queue depth avg {stats['avg_depth']:.1f} / max {stats['max_depth']} of {self.depth}")
+        print(f"      idle: producers {stats['producer_idle']:.1f}s (queue full), "
+              f"consumer {stats['consumer_idle']:.1f}s (queue empty)")
@@ -0,0 +1,192 @@
+# src/utils/rate_control.py
+
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from urllib.parse import urlparse
+
+# LinkedIn answers 999 instead of 429 when it wants us to back off
+THROTTLE_STATUSES = (429, 999)
+
+
+def parse_retry_after(value):
+    """Retry-After is either delta-seconds or an HTTP date; returns seconds (or None)"""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class AdaptiveRateController:
+    """
+    AIMD control of the per-host token bucket rates in a HostRateLimiter.
+    - additive increase after each healthy response, up to the host's ceiling
+    - multiplicative decrease on 429/999, errors, or latency rising well above
+      the host's baseline; Retry-After pauses the host's bucket outright
+    """
+
+    def __init__(self, rate_limiter, max_rates=None, min_rate=0.1, increase=0.1, decrease=0.5,
+                 latency_factor=2.0, default_ceiling=3.0):
+        self.rate_limiter = rate_limiter
+        self.max_rates = dict(max_rates or {})
+        self.min_rate = min_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.latency_factor = latency_factor
+        self.default_ceiling = default_ceiling
+        self.hosts = {}
+        self._lock = threading.Lock()
+
+    def _host_state(self, host, bucket):
+        state = self.hosts.get(host)
+        if state is None:
+            state = self.hosts[host] = {
+                'ceiling': self.max_rates.get(host, bucket.rate * self.default_ceiling),
+                'fast_latency': None,   # EWMA, alpha 0.3: what the host is doing now
+                'slow_latency': None,   # EWMA, alpha 0.05: the host's baseline
+                'samples': 0,
+                'throttled': 0,
+                'decreases': 0,
+            }
+        return state
+
+    def _decrease(self, bucket, state):
+        bucket.rate = max(self.min_rate, bucket.rate * self.decrease)
+        state['decreases'] += 1
+
+    def on_response(self, url, status, latency, retry_after=None):
+        host = urlparse(url).netloc
+        bucket = self.rate_limiter.bucket_for(host)
+        with self._lock:
+            state = self._host_state(host, bucket)
+
+            if status in THROTTLE_STATUSES:
+                state['throttled'] += 1
+                self._decrease(bucket, state)
+                # Without a Retry-After, sit out at least one interval at the new rate
+                bucket.pause(parse_retry_after(retry_after) or 1.0 / bucket.rate)
+                return
+
+            if state['fast_latency'] is None:
+                state['fast_latency'] = state['slow_latency'] = latency
+            else:
+                state['fast_latency'] += 0.3 * (latency - state['fast_latency'])
+                state['slow_latency'] += 0.05 * (latency - state['slow_latency'])
+            state['samples'] += 1
+
+            if status >= 500 or (
+                state['samples'] >= 5 and state['fast_latency'] > self.latency_factor * state['slow_latency']
+            ):
+                self._decrease(bucket, state)
+            else:
+                bucket.rate = min(state['ceiling'], bucket.rate + self.increase)
+
+    def on_error(self, url):
+        host = urlparse(url).netloc
+        bucket = self.rate_limiter.bucket_for(host)
+        with self._lock:
+            self._decrease(bucket, self._host_state(host, bucket))
+
+    def report(self):
+        with self._lock:
+            return {
+                host: {
+                    'rate': self.rate_limiter.bucket_for(host).rate,
+                    'ceiling': state['ceiling'],
+                    'throttled': state['throttled'],
+                    'decreases': state['decreases'],
+                }
+                for host, state in self.hosts.items()
+            }
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of making a request to a source whose circuit is open"""
+
+
+class CircuitBreaker:
+    """
+    closed -> (failure_threshold consecutive failures) -> open for `cooldown`
+    seconds -> half-open (one trial request) -> closed on success / open again on failure
+    """
+
+    def __init__(self, name, failure_threshold=5, cooldown=300):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.state = 'closed'
+        self.failures = 0
+        self.opened_at = None
+        self.trips = 0
+        self.last_error = None
+        self._trial_in_flight = False
+        self._lock = threading.Lock()
+
+    def allow(self):
+        with self._lock:
+            if self.state == 'closed':
+                return True
+            if self.state == 'open' and time.monotonic() - self.opened_at >= self.cooldown:
+                self.state = 'half_open'
+                self._trial_in_flight = False
+            if self.state == 'half_open' and not self._trial_in_flight:
+                self._trial_in_flight = True
+                return True
+            return False
+
+    def record_success(self):
+        with self._lock:
+            self.state = 'closed'
+            self.failures = 0
+            self._trial_in_flight = False
+
+    def record_failure(self, error=None):
+        with self._lock:
+            self.failures += 1
+            self.last_error = error
+            self._trial_in_flight = False
+            if self.state == 'half_open' or self.failures >= self.failure_threshold:
+                if self.state != 'open':
+                    self.trips += 1
+                    print(f"  🔌 Circuit open for {self.name} ({error}); pausing it for {self.cooldown}s")
+                self.state = 'open'
+                self.opened_at = time.monotonic()
+
+    def cooldown_remaining(self):
+        if self.state != 'open':
+            return 0.0
+        return max(0.0, self.cooldown - (time.monotonic() - self.opened_at))
+
+
+class CircuitBreakerRegistry:
+    """One breaker per host (or any other source name)"""
+
+    def __init__(self, failure_threshold=5, cooldown=300):
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.breakers = {}
+        self._lock = threading.Lock()
+
+    def get(self, name):
+        with self._lock:
+            breaker = self.breakers.get(name)
+            if breaker is None:
+                breaker = self.breakers[name] = CircuitBreaker(name, self.failure_threshold, self.cooldown)
+            return breaker
+
+    def for_url(self, url):
+        return self.get(urlparse(url).netloc)
+
+    def tripped(self):
+        """Breakers that opened at least once during this run"""
+        return [b for b in self.breakers.values() if b.trips]
@@ -0,0 +1,59 @@
+# src/utils/render_manifest.py
+
+import hashlib
+import json
+import os
+import threading
+import time
+
+
+class RenderManifest:
+    """
+    JSON manifest of rendered PDFs: output path -> hash of (template version,
+    cv_data, title, company). A document whose hash is unchanged and whose
+    file still exists is skipped on later runs; only changed or new CVs are
+    rendered again. Bump the generator's TEMPLATE_VERSION when the layout
+    changes so every PDF is rebuilt once.
+    """
+
+    def __init__(self, path='data/resumes/generated/.render_manifest.json'):
+        self.path = path
+        self.stats = {'skipped': 0, 'rendered': 0}
+        self._lock = threading.Lock()
+        self.entries = {}
+        if os.path.exists(path):
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    self.entries = json.load(f)
+            except (OSError, ValueError):
+                # Unreadable manifest: everything renders again and it is rewritten
+                self.entries = {}
+
+    @staticmethod
+    def digest(cv_data, job_title, company_name, template_version):
+        payload = json.dumps([template_version, cv_data, job_title, company_name],
+                             sort_keys=True, ensure_ascii=False, separators=(',', ':'))
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+    def is_current(self, output_path, digest):
+        with self._lock:
+            entry = self.entries.get(output_path)
+            current = entry is not None and entry.get('hash') == digest and os.path.exists(output_path)
+            if current:
+                self.stats['skipped'] += 1
+        return current
+
+    def record(self, output_path, digest):
+        with self._lock:
+            self.entries[output_path] = {'hash': digest, 'rendered_at': time.time()}
+            self.stats['rendered'] += 1
+
+    def save(self):
+        """Write atomically, so an interrupted run never leaves a corrupt manifest"""
+        with self._lock:
+            if os.path.dirname(self.path):
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = self.path + '.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(self.entries, f, indent=1, sort_keys=True)
+            os.replace(tmp_path, self.path)
@@ -0,0 +1,91 @@
+# src/utils/seen_jobs.py
+
+from datetime import datetime
+
+from src.utils.sqlite_store import SQLiteStore
+
+
+class SeenJobsIndex(SQLiteStore):
+    """
+    Persistent index of every posting the scraper has already seen, keyed by
+    canonical job ID (see src/utils/job_identity.py). Lets repeated runs stop
+    paginating newest-first results early. Postings are marked as tailored
+    separately, once their CV has been saved, so --new-only still picks up
+    jobs that were seen but never tailored (over --max-cvs, or a failed call).
+    """
+
+    SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS seen_jobs (
+            job_id TEXT PRIMARY KEY,
+            title TEXT,
+            company TEXT,
+            url TEXT,
+            source TEXT,
+            first_seen TEXT,
+            last_seen TEXT,
+            tailored_at TEXT
+        )
+        """,
+    )
+
+    def __init__(self, path='data/jobs/seen_jobs.sqlite'):
+        super().__init__(path)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(seen_jobs)")}
+        if 'tailored_at' not in columns:
+            # Index created before tailoring was tracked
+            self._conn.execute("ALTER TABLE seen_jobs ADD COLUMN tailored_at TEXT")
+        self._conn.commit()
+
+    def known_ids(self, job_ids):
+        """Return the subset of job_ids already in the index"""
+        return self._select_ids(job_ids, "SELECT job_id FROM seen_jobs WHERE job_id IN ({})")
+
+    def tailored_ids(self, job_ids):
+        """Return the subset of job_ids whose tailored CV was saved in an earlier run"""
+        return self._select_ids(job_ids, "SELECT job_id FROM seen_jobs WHERE tailored_at IS NOT NULL AND job_id IN ({})")
+
+    def _select_ids(self, job_ids, query):
+        job_ids = [j for j in set(job_ids) if j]
+        found = set()
+        with self._lock:
+            # Stay well under SQLite's bound-parameter limit
+            for i in range(0, len(job_ids), 500):
+                chunk = job_ids[i:i + 500]
+                rows = self._conn.execute(query.format(','.join('?' * len(chunk))), chunk).fetchall()
+                found.update(row[0] for row in rows)
+        return found
+
+    def mark_seen(self, entries):
+        """Upsert dicts with job_id/title/company/url/source; first_seen is kept on repeats"""
+        now = datetime.now().isoformat()
+        rows = [
+            (e['job_id'], e.get('title'), e.get('company'), e.get('url'), e.get('source'), now, now)
+            for e in entries if e.get('job_id')
+        ]
+        with self._lock:
+            self._conn.executemany("""
+                INSERT INTO seen_jobs (job_id, title, company, url, source, first_seen, last_seen)
+                VALUES (?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(job_id) DO UPDATE SET last_seen = excluded.last_seen
+            """, rows)
+            self._conn.commit()
+
+    def mark_tailored(self, entries):
+        """Record that these postings (dicts as for mark_seen) now have a saved tailored CV"""
+        now = datetime.now().isoformat()
+        rows = [
+            (e['job_id'], e.get('title'), e.get('company'), e.get('url'), e.get('source'), now, now, now)
+            for e in entries if e.get('job_id')
+        ]
+        with self._lock:
+            self._conn.executemany("""
+                INSERT INTO seen_jobs (job_id, title, company, url, source, first_seen, last_seen, tailored_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT(job_id) DO UPDATE SET tailored_at = excluded.tailored_at
+            """, rows)
+            self._conn.commit()
+
+    def __len__(self):
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM seen_jobs").fetchone()[0]
@@ -0,0 +1,87 @@
+# src/utils/source_scheduler.py
+
+import threading
+import time
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+# fn(cancel_event) -> list of job dicts. Sources should check cancel_event
+# between requests and return whatever they have once it is set.
+JobSource = namedtuple('JobSource', ['name', 'fn', 'deadline'])
+
+
+class SourceScheduler:
+    """
+    Runs all enabled job sources at once on a worker pool.
+    - each source gets a wall-clock deadline; overrunning sources are signalled
+      to cancel and their results are dropped
+    - results are merged in completion order, so total time tracks the slowest
+      source that finishes in time rather than the sum of all sources
+    """
+
+    def __init__(self, max_workers=8):
+        self.max_workers = max_workers
+        self.sources = []
+        self.report = {}
+
+    def register(self, name, fn, deadline=60):
+        self.sources.append(JobSource(name, fn, deadline))
+
+    def _run_source(self, source, cancel_event):
+        started = time.monotonic()
+        jobs = source.fn(cancel_event) or []
+        return jobs, time.monotonic() - started
+
+    def run(self, on_result=None):
+        """Run every registered source and return the merged job list"""
+        self.report = {}
+        if not self.sources:
+            return []
+
+        all_jobs = []
+        started = time.monotonic()
+        executor = ThreadPoolExecutor(max_workers=min(self.max_workers, len(self.sources)), thread_name_prefix='source')
+        cancel_events = {}
+        futures = {}
+        for source in self.sources:
+            cancel_events[source.name] = threading.Event()
+            futures[executor.submit(self._run_source, source, cancel_events[source.name])] = source
+
+        pending = set(futures)
+        try:
+            while pending:
+                now = time.monotonic()
+                next_deadline = min(started + futures[f].deadline for f in pending)
+                done, pending = wait(pending, timeout=max(0.0, next_deadline - now), return_when=FIRST_COMPLETED)
+
+                for future in done:
+                    source = futures[future]
+                    try:
+                        jobs, elapsed = future.result()
+                    except Exception as e:
+                        print(f"  ❌ Source {source.name} failed: {e}")
+                        self.report[source.name] = {'status': 'error', 'jobs': 0, 'elapsed': time.monotonic() - started, 'error': str(e)}
+                        continue
+                    print(f"  ✅ Source {source.name}: {len(jobs)} jobs in {elapsed:.1f}s")
+                    self.report[source.name] = {'status': 'ok', 'jobs': len(jobs), 'elapsed': elapsed}
+                    all_jobs.extend(jobs)
+                    if on_result:
+                        on_result(source.name, jobs)
+
+                now = time.monotonic()
+                for future in list(pending):
+                    source = futures[future]
+                    if now >= started + source.deadline:
+                        # Cancellation path: signal the source, stop waiting for it
+                        cancel_events[source.name].set()
+                        future.cancel()
+                        pending.discard(future)
+                        print(f"  ⏱️  Source {source.name} missed its {source.deadline}s deadline, cancelled")
+                        self.report[source.name] = {'status': 'timeout', 'jobs': 0, 'elapsed': now - started}
+        finally:
+            for event in cancel_events.values():
+                event.set()
+            # Don't block on sources still stuck in a request; they exit at their next cancel check
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        return all_jobs
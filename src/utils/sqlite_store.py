@@ -0,0 +1,49 @@
+# src/utils/sqlite_store.py
+
+import os
+import sqlite3
+import threading
+
+
+class SQLiteStore:
+    """
+    Shared base for the on-disk SQLite stores (HTTP/LLM caches, seen jobs, JD
+    store, reuse index): opens `path` (creating its directory), applies the
+    subclass's SCHEMA statements, and serialises access from any thread
+    through one lock around one connection.
+    """
+
+    SCHEMA = ()   # CREATE TABLE / CREATE INDEX statements, run on open
+
+    def __init__(self, path):
+        self.path = path
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        for statement in self.SCHEMA:
+            self._conn.execute(statement)
+        self._conn.commit()
+
+    def _evict_lru(self, table, max_bytes):
+        """
+        Delete least-recently-used rows of `table` (stored_size / last_access
+        columns) until their total size fits max_bytes; returns how many were
+        dropped (lock held)
+        """
+        total = self._conn.execute(f"SELECT COALESCE(SUM(stored_size), 0) FROM {table}").fetchone()[0]
+        if total <= max_bytes:
+            return 0
+        evicted = 0
+        rows = self._conn.execute(f"SELECT key, stored_size FROM {table} ORDER BY last_access ASC").fetchall()
+        for key, size in rows:
+            if total <= max_bytes:
+                break
+            self._conn.execute(f"DELETE FROM {table} WHERE key = ?", (key,))
+            total -= size
+            evicted += 1
+        return evicted
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
@@ -0,0 +1,128 @@
+# src/utils/tailoring_reuse.py
+
+import copy
+import json
+import re
+import time
+import zlib
+
+from src.utils.job_identity import NearDuplicateDetector, job_shingles
+from src.utils.sqlite_store import SQLiteStore
+
+
+class TailoringReuseIndex(SQLiteStore):
+    """
+    On-disk similarity index of past tailoring results (SQLite + MinHash/LSH).
+    Every tailored CV is stored with the MinHash signature of its job (title
+    + normalized JD shingles, see job_shingles). A repost or multi-location
+    copy whose signature is at least `threshold` similar to a stored one
+    reuses that result instead of a new Gemini call.
+    Results are grouped by a profile key (prompt version, model, CV, pool...),
+    so a result tailored against an older CV is never reused.
+    """
+
+    SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS results (
+            key TEXT PRIMARY KEY,
+            profile TEXT,
+            title TEXT,
+            company TEXT,
+            url TEXT,
+            signature TEXT,
+            body BLOB,
+            stored_at REAL
+        )
+        """,
+    )
+
+    def __init__(self, path='data/cache/reuse_index.sqlite', threshold=0.8):
+        super().__init__(path)
+        self.stats = {'lookups': 0, 'reused': 0, 'stored': 0}
+        self.detector = NearDuplicateDetector(threshold=threshold)
+
+        # Signatures are small; the LSH buckets are rebuilt in memory on open
+        for key, profile, signature in self._conn.execute("SELECT key, profile, signature FROM results"):
+            self.detector.add(key, tuple(json.loads(signature)), group=profile)
+
+    def signature(self, job, job_description):
+        return self.detector.signature(job_shingles({'title': job.get('title', ''), 'description': job_description}))
+
+    def find(self, profile, job, job_description):
+        """Most similar stored result for this profile: dict with result, title, company, url, similarity; or None"""
+        signature = self.signature(job, job_description)
+        with self._lock:
+            self.stats['lookups'] += 1
+            match = self.detector.query(signature, group=profile)
+            if match is None:
+                return None
+            key, similarity = match
+            row = self._conn.execute(
+                "SELECT title, company, url, body FROM results WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            self.stats['reused'] += 1
+        title, company, url, body = row
+        return {
+            'key': key,
+            'title': title,
+            'company': company,
+            'url': url,
+            'similarity': similarity,
+            'result': json.loads(zlib.decompress(body).decode('utf-8')),
+        }
+
+    def add(self, profile, key, job, job_description, result):
+        signature = self.signature(job, job_description)
+        if signature is None:
+            return
+        body = zlib.compress(json.dumps(result, separators=(',', ':')).encode('utf-8'))
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, profile, job.get('title', ''), job.get('company', ''), job.get('url', ''),
+                 json.dumps(signature), body, time.time())
+            )
+            self._conn.commit()
+            if key not in self.detector.signatures:
+                self.detector.add(key, signature, group=profile)
+            self.stats['stored'] += 1
+
+    def print_stats(self):
+        with self._lock:
+            count = self._conn.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        print("\n♻️  REUSE INDEX:")
+        print(f"   Reused: {self.stats['reused']}/{self.stats['lookups']} lookups  New: {self.stats['stored']}  "
+              f"Stored results: {count} (threshold {self.detector.threshold:.0%})")
+
+
+def patch_company(result, old_company, new_company):
+    """
+    Copy of a reused result addressed to the new employer: the source company's
+    name is replaced only where the result talks about the target employer
+    (professional_summary and job_analysis). The candidate's own experience,
+    education and projects are never touched - they may well mention the old
+    company as a real past employer.
+    """
+    result = copy.deepcopy(result)
+    if not old_company or not new_company or old_company.strip().lower() == new_company.strip().lower():
+        return result
+    # Whole words only: no match inside identifiers or hyphenated words ("Meta-learning")
+    pattern = re.compile(r'(?<![\w-])' + re.escape(old_company.strip()) + r'(?![\w-])', re.IGNORECASE)
+
+    def patch(value):
+        if isinstance(value, str):
+            return pattern.sub(new_company.strip(), value)
+        if isinstance(value, list):
+            return [patch(v) for v in value]
+        if isinstance(value, dict):
+            return {k: patch(v) for k, v in value.items()}
+        return value
+
+    if isinstance(result.get('job_analysis'), dict):
+        result['job_analysis'] = patch(result['job_analysis'])
+    tailored_cv = result.get('tailored_cv')
+    if isinstance(tailored_cv, dict) and isinstance(tailored_cv.get('professional_summary'), str):
+        tailored_cv['professional_summary'] = patch(tailored_cv['professional_summary'])
+    return result
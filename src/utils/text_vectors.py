@@ -0,0 +1,78 @@
+# src/utils/text_vectors.py
+
+import re
+
+import numpy as np
+
+# Keeps tech tokens like 'c++', 'c#', 'node.js' and 'scikit-learn' intact
+_TOKEN = re.compile(r'[a-z0-9][a-z0-9+#.\-]*')
+
+STOPWORDS = {
+    'a', 'an', 'and', 'are', 'as', 'at', 'be', 'by', 'for', 'from', 'has', 'have', 'in', 'is', 'it',
+    'its', 'of', 'on', 'or', 'our', 'that', 'the', 'their', 'this', 'to', 'we', 'will', 'with', 'you',
+    'your', 'who', 'can', 'all', 'using', 'used', 'also', 'into', 'such', 'other', 'any', 'e.g', 'i.e',
+}
+
+
+def tokenize(text):
+    tokens = []
+    for token in _TOKEN.findall((text or '').lower()):
+        token = token.rstrip('.-')
+        if token and token not in STOPWORDS:
+            tokens.append(token)
+    return tokens
+
+
+def flatten_text(obj):
+    """All string/number leaves of a JSON-like object, space-joined (e.g. a project entry)"""
+    if isinstance(obj, dict):
+        return ' '.join(flatten_text(v) for v in obj.values())
+    if isinstance(obj, (list, tuple)):
+        return ' '.join(flatten_text(v) for v in obj)
+    if obj is None or isinstance(obj, bool):
+        return ''
+    return str(obj)
+
+
+class BM25Index:
+    """
+    Okapi BM25 over a small corpus, as one dense NumPy weight matrix.
+    The term weights are computed once at build time, so scoring a query is a
+    column gather and a row sum: cheap enough to run per job.
+    """
+
+    def __init__(self, documents, k1=1.5, b=0.75):
+        docs = [tokenize(d) for d in documents]
+        self.vocab = {}
+        for tokens in docs:
+            for token in tokens:
+                self.vocab.setdefault(token, len(self.vocab))
+
+        n_docs = len(docs)
+        tf = np.zeros((n_docs, max(1, len(self.vocab))), dtype=np.float32)
+        for row, tokens in enumerate(docs):
+            if tokens:
+                np.add.at(tf[row], [self.vocab[t] for t in tokens], 1.0)
+
+        doc_len = tf.sum(axis=1, keepdims=True)
+        avg_len = float(doc_len.mean()) if n_docs and doc_len.mean() > 0 else 1.0
+        df = (tf > 0).sum(axis=0)
+        self.idf = np.log1p((n_docs - df + 0.5) / (df + 0.5)).astype(np.float32)
+        norm = k1 * (1.0 - b + b * doc_len / avg_len)
+        self.weights = self.idf * tf * (k1 + 1.0) / (tf + norm)
+
+    def __len__(self):
+        return self.weights.shape[0]
+
+    def scores(self, query):
+        """BM25 score of every document for the query text (unique query terms)"""
+        ids = sorted({self.vocab[t] for t in tokenize(query) if t in self.vocab})
+        if not ids:
+            return np.zeros(len(self), dtype=np.float32)
+        return self.weights[:, ids].sum(axis=1)
+
+    def top_k(self, query, k):
+        """Indices of the k best-scoring documents, best first (ties keep corpus order)"""
+        scores = self.scores(query)
+        order = np.argsort(-scores, kind='stable')[:k]
+        return [int(i) for i in order], scores
@@ -0,0 +1,115 @@
+# src/utils/title_classifier.py
+
+import re
+from collections import namedtuple
+
+# Single source of truth for the STRICT "AI + Intern/Trainee" title rules.
+# Both JobLinkScraper.filter_jobs and the LinkedIn inline filter use this module.
+
+# Phrases that, if found, automatically qualify the job
+VALID_PHRASES = [
+    'ai intern',
+    'ai trainee',
+    'ai research intern',
+    'artificial intelligence intern',
+    'machine learning intern',
+    'ml intern',
+    'ai placement',
+    'artificial intelligence placement',
+]
+
+# Component logic: title must have [AI term] AND [Intern term].
+# All terms are whole words, so 'ai' does not match 'trAIning', 'remAIl', etc.
+AI_TERMS = [
+    'ai',
+    'artificial intelligence',
+    'machine learning',
+    'ml',
+    'deep learning',
+    'computer vision',
+    'nlp',
+    'llm',
+    'generative ai',
+]
+
+INTERN_TERMS = [
+    'intern',
+    'internship',
+    'trainee',
+    'placement',
+    'student',
+    'undergraduate',
+]
+
+# Blacklist terms match at the start of a word ('lead' also drops 'leadership')
+BLACKLIST = ['senior', 'manager', 'lead', 'director', 'marketing', 'sales', 'hr', 'recruiter', 'agent', 'attorney', 'counsel']
+
+REASON_BLACKLIST = 'blacklist'
+REASON_PHRASE = 'phrase'
+REASON_COMPONENTS = 'ai+intern'
+REASON_NO_AI = 'missing_ai_term'
+REASON_NO_INTERN = 'missing_intern_term'
+REASON_NO_TERMS = 'no_terms'
+
+TitleVerdict = namedtuple('TitleVerdict', ['is_match', 'reason', 'term'])
+
+
+def _alternation(terms):
+    # Longest first so 'internship' wins over 'intern', 'generative ai' over 'ai'
+    return '|'.join(re.escape(t) for t in sorted(terms, key=len, reverse=True))
+
+
+# One combined pattern, compiled once at import. A single finditer() pass over
+# the title tells us which group (blacklist / phrase / ai / intern) each hit is.
+_TITLE_PATTERN = re.compile(
+    r'\b(?:'
+    rf'(?P<blacklist>{_alternation(BLACKLIST)})'
+    rf'|(?P<phrase>{_alternation(VALID_PHRASES)})\b'
+    rf'|(?P<ai>{_alternation(AI_TERMS)})\b'
+    rf'|(?P<intern>{_alternation(INTERN_TERMS)})\b'
+    r')',
+    re.IGNORECASE
+)
+
+
+def classify_title(title):
+    """Classify one job title. Returns TitleVerdict(is_match, reason, term)."""
+    phrase = ai = intern = None
+
+    for match in _TITLE_PATTERN.finditer(title):
+        group = match.lastgroup
+        if group == 'blacklist':
+            # Blacklist always wins, no need to look any further
+            return TitleVerdict(False, REASON_BLACKLIST, match.group().lower())
+        if group == 'phrase':
+            phrase = phrase or match.group()
+        elif group == 'ai':
+            ai = ai or match.group()
+        else:
+            intern = intern or match.group()
+
+    if phrase:
+        return TitleVerdict(True, REASON_PHRASE, phrase.lower())
+    if ai and intern:
+        return TitleVerdict(True, REASON_COMPONENTS, f"{ai.lower()}+{intern.lower()}")
+    if intern:
+        return TitleVerdict(False, REASON_NO_AI, intern.lower())
+    if ai:
+        return TitleVerdict(False, REASON_NO_INTERN, ai.lower())
+    return TitleVerdict(False, REASON_NO_TERMS, None)
+
+
+def classify_titles(titles):
+    """Batch classification; repeated titles (very common across searches) are classified once"""
+    seen = {}
+    verdicts = []
+    for title in titles:
+        verdict = seen.get(title)
+        if verdict is None:
+            verdict = seen[title] = classify_title(title)
+        verdicts.append(verdict)
+    return verdicts
+
+
+def is_relevant_title(title):
+    return classify_title(title).is_match